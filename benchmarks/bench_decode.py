@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+import orjson
+
+
+def _iso(dt: datetime) -> str:
+    return dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def payloads(vitals_records: int) -> dict[str, Any]:
+    now = datetime.now(timezone.utc)
+    side_status = {
+        "currentTemperatureF": 80,
+        "targetTemperatureF": 78,
+        "secondsRemaining": 28800,
+        "isAlarmVibrating": False,
+        "isOn": True,
+    }
+    return {
+        "device_status": {
+            "left": dict(side_status),
+            "right": dict(side_status),
+            "waterLevel": "true",
+            "isPriming": False,
+            "coverVersion": "Pod 4",
+            "hubVersion": "Pod 4",
+        },
+        "settings": {
+            "timeZone": "UTC",
+            "left": {"name": "Left", "awayMode": False},
+            "right": {"name": "Right", "awayMode": False},
+            "linkBothSides": False,
+            "lastPrime": _iso(now),
+        },
+        "presence": {side: {"present": True, "lastUpdatedAt": _iso(now)} for side in ("left", "right")},
+        "vitals": [
+            {
+                "id": index,
+                "side": "left",
+                "timestamp": _iso(now - timedelta(minutes=index)),
+                "heart_rate": 60 + index % 10,
+                "hrv": 40 + index % 30,
+                "breathing_rate": 12 + index % 6,
+            }
+            for index in range(vitals_records)
+        ],
+    }
+
+
+def _time_per_op(func: Callable[[], Any], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations
+
+
+def _allocations(func: Callable[[], Any]) -> tuple[int, float]:
+    func()
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sys.getallocatedblocks() - blocks_before
+    del result
+    return blocks, peak / 1024
+
+
+def measure(name: str, func: Callable[[], Any], iterations: int) -> dict[str, Any]:
+    blocks, peak_kib = _allocations(func)
+    return {
+        f"{name}_us": round(_time_per_op(func, iterations) * 1e6, 2),
+        f"{name}_blocks": blocks,
+        f"{name}_peak_kib": round(peak_kib, 2),
+    }
+
+
+def run(iterations: int, vitals_records: int) -> dict[str, dict[str, Any]]:
+    results: dict[str, dict[str, Any]] = {}
+    for key, payload in payloads(vitals_records).items():
+        body = json.dumps(payload).encode()
+        row: dict[str, Any] = {"bytes": len(body)}
+        row.update(measure("json_decode", lambda: json.loads(body), iterations))
+        row.update(measure("orjson_decode", lambda: orjson.loads(body), iterations))
+        row.update(measure("json_encode", lambda: json.dumps(payload).encode(), iterations))
+        row.update(measure("orjson_encode", lambda: orjson.dumps(payload), iterations))
+        results[key] = row
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare stdlib json and orjson on free-sleep payloads")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--vitals-records", type=int, default=60)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+    results = run(args.iterations, args.vitals_records)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for key, row in results.items():
+        print(key)
+        for name, value in row.items():
+            print(f"  {name:24} {value}")
+
+
+if __name__ == "__main__":
+    main()
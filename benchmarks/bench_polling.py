@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import time
+import tracemalloc
+from typing import Any
+
+from .fake_pod import FakePod, FakePodConfig
+from .harness import BenchEntry, Pod, create_hass, max_per_window, percentile, run_virtual
+
+
+def _windows(raw: str) -> list[tuple[float, float]]:
+    if not raw:
+        return []
+    return [tuple(float(v) for v in part.split("-")) for part in raw.split(",")]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Drive the Free Sleep coordinators against an in-process fake pod")
+    parser.add_argument("--minutes", type=float, default=60.0)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--vitals-latency-ms", type=float, default=250.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--outages", default="", help="minute ranges the pod hangs, e.g. 20-25,40-41")
+    parser.add_argument("--presence", default="10-50", help="minute ranges someone is in bed")
+    parser.add_argument("--option", action="append", default=[], metavar="KEY=VALUE", help="integration option override")
+    parser.add_argument("--pods", type=int, default=1, help="config entries polling the fake pod")
+    parser.add_argument("--shared-session", action="store_true", help="use Home Assistant's shared HTTP session")
+    parser.add_argument("--restart", action="store_true", help="restart every pod from its snapshot while the pod is down")
+    parser.add_argument("--json", action="store_true")
+    return parser.parse_args()
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    pod_server = FakePod(FakePodConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        vitals_latency_ms=args.vitals_latency_ms,
+        outages=_windows(args.outages),
+        presence_schedule=_windows(args.presence),
+    ))
+    await pod_server.start()
+    hass = await create_hass()
+    options = {key: float(value) for key, value in (item.split("=", 1) for item in args.option)}
+    pods = [
+        Pod(hass, BenchEntry(pod_server.port, options, f"benchmark-{index}"), shared_session=args.shared_session)
+        for index in range(args.pods)
+    ]
+    for pod in pods:
+        await pod.async_setup()
+    pod_server.config.failure_rate = args.failure_rate
+
+    loop = asyncio.get_running_loop()
+    requests_before = pod_server.total_requests
+    connections_before = pod_server.connections
+    writes_before = sum(pod.state_writes for pod in pods)
+    rows_before = sum(pod.recorder_rows for pod in pods)
+    tracemalloc.start()
+    cpu_start = time.process_time()
+    sim_start = loop.time()
+    await asyncio.sleep(args.minutes * 60)
+    sim_secs = loop.time() - sim_start
+    cpu_secs = time.process_time() - cpu_start
+    requests = pod_server.total_requests - requests_before
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    scheduler = pods[0].client.scheduler
+    fairness = {pod_id: stats.as_dict() for pod_id, stats in sorted(scheduler.pods.items())}
+    peak_in_flight = scheduler.peak_in_flight
+    snapshot_saves = sum(pod.snapshot.saves for pod in pods)
+    rows = sum(pod.recorder_rows for pod in pods) - rows_before
+
+    for pod in pods:
+        await pod.async_unload()
+    restart = await _restart(hass, pod_server, pods, args) if args.restart else {}
+    await hass.async_stop(force=True)
+    await pod_server.stop()
+
+    result: dict[str, Any] = {
+        "simulated_minutes": round(sim_secs / 60, 2),
+        "pods": len(pods),
+        "requests_per_sec": round(requests / sim_secs, 3),
+        "requests_by_endpoint": dict(sorted(pod_server.request_counts.items())),
+        "bytes_from_pod": pod_server.bytes_sent,
+        "tcp_connections": pod_server.connections - connections_before,
+        "state_writes_per_min": round((sum(pod.state_writes for pod in pods) - writes_before) / (sim_secs / 60), 2),
+        "recorder_rows_per_day": round(rows / (sim_secs / 86400)),
+        "event_loop_cpu_secs": round(cpu_secs, 3),
+        "cpu_ms_per_request": round(cpu_secs * 1000 / requests, 3) if requests else None,
+        "peak_traced_memory_kib": round(peak_bytes / 1024, 1),
+        "peak_in_flight_requests": peak_in_flight,
+        "setup_ms_max": _ms(max(pod.setup_secs for pod in pods)),
+        "vitals_ready_ms_max": _ms(max(pod.vitals_ready_secs or 0.0 for pod in pods)),
+        "snapshot_saves_per_hour": round(snapshot_saves / (sim_secs / 3600), 2),
+        **restart,
+    }
+    for name in ("coordinator", "presence"):
+        samples = [sample for pod in pods for sample in pod.refresh_secs[name]]
+        starts = [start for pod in pods for start in pod.refresh_starts[name] if start >= sim_start]
+        result[f"{name}_refresh_ms_p50"] = _ms(percentile(samples, 50))
+        result[f"{name}_refresh_ms_p99"] = _ms(percentile(samples, 99))
+        result[f"{name}_refreshes"] = len(samples)
+        result[f"{name}_max_refresh_starts_per_sec"] = max_per_window(starts, 1.0)
+    telemetry = pods[0].client.telemetry
+    result["unchanged_ratio_by_endpoint"] = {
+        name: stats.unchanged_ratio for name, stats in sorted(telemetry.endpoints.items())
+    }
+    result["collapsed_by_endpoint"] = {
+        name: stats.collapsed + stats.cache_hits for name, stats in sorted(telemetry.endpoints.items())
+        if stats.collapsed or stats.cache_hits
+    }
+    for name, histogram in sorted(telemetry.timings.items()):
+        result[f"{name}_ms_p95"] = histogram.quantile(0.95)
+    result["scheduler_fairness"] = fairness
+    return result
+
+
+async def _restart(hass: Any, pod_server: FakePod, pods: list[Pod], args: argparse.Namespace) -> dict[str, Any]:
+    pod_server.config.outages.append((pod_server.elapsed_secs / 60, math.inf))
+    restarted = [Pod(hass, pod.entry, shared_session=args.shared_session) for pod in pods]
+    for pod in restarted:
+        await pod.async_setup()
+    await asyncio.sleep(30)
+    entities = [entity for pod in restarted for entity in pod.entities if entity.entity_registry_enabled_default]
+    result = {
+        "restart_setup_ms_max": _ms(max(pod.setup_secs for pod in restarted)),
+        "restart_restored_pods": sum(pod.restored for pod in restarted),
+        "restart_available_entities": f"{sum(entity.available for entity in entities)}/{len(entities)}",
+    }
+    for pod in restarted:
+        await pod.async_unload()
+    return result
+
+
+def _ms(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+def main() -> None:
+    args = parse_args()
+    result = run_virtual(lambda: run(args))
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+    for key, value in result.items():
+        print(f"{key:32} {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from custom_components.free_sleep.const import VITALS_HISTORY_CAPACITY, VITALS_HISTORY_SAMPLE_SECS
+from custom_components.free_sleep.vitals import RollingVitalsWindow
+
+
+def _iso(dt: datetime) -> str:
+    return dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def records(days: float, now: datetime, seed: int = 1) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    count = int(days * 86400 / VITALS_HISTORY_SAMPLE_SECS)
+    start = now - timedelta(seconds=count * VITALS_HISTORY_SAMPLE_SECS)
+    return [
+        {
+            "id": index,
+            "side": "left",
+            "timestamp": _iso(start + timedelta(seconds=index * VITALS_HISTORY_SAMPLE_SECS)),
+            "heart_rate": rng.randint(50, 70),
+            "hrv": rng.randint(30, 80),
+            "breathing_rate": rng.randint(12, 18),
+        }
+        for index in range(count)
+    ]
+
+
+def measure(days: float, window_hours: int) -> dict[str, Any]:
+    now = datetime.now(timezone.utc)
+    batch = records(days, now)
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    window = RollingVitalsWindow(window_hours, VITALS_HISTORY_CAPACITY)
+    window.ingest(batch)
+    window.evict(now)
+    ingest_secs = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    summary = window.summary(now)
+    summary_secs = time.perf_counter() - start
+    return {
+        "records": len(batch),
+        "stored_samples": len(window.history),
+        "ingest_us_per_record": round(ingest_secs * 1e6 / len(batch), 2) if batch else None,
+        "summary_ms": round(summary_secs * 1000, 2),
+        "history_kib": round(window.history.nbytes / 1024, 1),
+        "retained_kib": round((retained - before) / 1024, 1),
+        "peak_kib": round((peak - before) / 1024, 1),
+        "p50HeartRate": summary["p50HeartRate"],
+        "restingHeartRate": summary["restingHeartRate"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure the per-side vitals history ring buffer")
+    parser.add_argument("--days", type=float, action="append", help="days of samples to ingest (repeatable)")
+    parser.add_argument("--window-hours", type=int, default=168)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+    results = {f"{days:g}d": measure(days, args.window_hours) for days in args.days or (1, 7, 14)}
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for key, row in results.items():
+        print(key)
+        for name, value in row.items():
+            print(f"  {name:24} {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import weakref
+from datetime import datetime, timezone
+from typing import Any
+
+from aiohttp import web
+from homeassistant.util import dt as dt_util
+
+from custom_components.free_sleep.const import (
+    API_DEVICE_STATUS, API_SETTINGS, API_METRICS_PRESENCE, API_VITALS, API_SCHEDULES,
+)
+from custom_components.free_sleep.schedules import WEEKDAYS
+from custom_components.free_sleep.writes import deep_merge
+
+API_VITALS_SUMMARY = "/api/metrics/vitals/summary"
+
+
+def _iso(dt: datetime) -> str:
+    return dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+class FakePodConfig:
+    def __init__(
+        self,
+        latency_ms: float = 20.0,
+        jitter_ms: float = 10.0,
+        failure_rate: float = 0.0,
+        outages: list[tuple[float, float]] | None = None,
+        presence_schedule: list[tuple[float, float]] | None = None,
+        vitals_sample_secs: float = 60.0,
+        vitals_latency_ms: float = 250.0,
+        seed: int = 1,
+    ) -> None:
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.outages = outages or []
+        self.presence_schedule = presence_schedule or []
+        self.vitals_sample_secs = vitals_sample_secs
+        self.vitals_latency_ms = vitals_latency_ms
+        self.seed = seed
+
+
+class FakePod:
+    def __init__(self, config: FakePodConfig) -> None:
+        self.config = config
+        self._random = random.Random(config.seed)
+        self._loop = asyncio.get_running_loop()
+        self._started_at = self._loop.time()
+        self._runner: web.AppRunner | None = None
+        self.port = 0
+        self.request_counts: dict[str, int] = {}
+        self.bytes_sent = 0
+        self.connections = 0
+        self._transports: weakref.WeakSet = weakref.WeakSet()
+        self.device_status: dict[str, Any] = {
+            side: {
+                "currentTemperatureF": 80,
+                "targetTemperatureF": 80,
+                "secondsRemaining": 8 * 3600,
+                "isAlarmVibrating": False,
+                "isOn": True,
+            }
+            for side in ("left", "right")
+        }
+        self.device_status.update({"waterLevel": "true", "isPriming": False, "coverVersion": "Pod 4", "hubVersion": "Pod 4"})
+        self.settings: dict[str, Any] = {
+            "timeZone": "UTC",
+            "left": {"name": "Left", "awayMode": False},
+            "right": {"name": "Right", "awayMode": False},
+            "linkBothSides": False,
+            "lastPrime": _iso(dt_util.utcnow()),
+        }
+        self.schedules: dict[str, Any] = {
+            side: {
+                day: {
+                    "temperatures": {"23:00": 78, "02:00": 76, "05:00": 80},
+                    "alarm": {"time": "07:00", "enabled": True, "vibrationIntensity": 50, "vibrationPattern": "rise",
+                              "duration": 10, "alarmTemperature": 82},
+                    "power": {"on": "21:00", "off": "08:00", "onTemperature": 82, "enabled": True},
+                }
+                for day in WEEKDAYS
+            }
+            for side in ("left", "right")
+        }
+        self.vitals: dict[str, list[tuple[datetime, dict[str, Any]]]] = {"left": [], "right": []}
+        self._vitals_id = 0
+        self._next_vitals_at = 0.0
+        self._advanced_at = 0.0
+
+    @property
+    def elapsed_secs(self) -> float:
+        return self._loop.time() - self._started_at
+
+    @property
+    def total_requests(self) -> int:
+        return sum(self.request_counts.values())
+
+    async def start(self) -> None:
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get(API_DEVICE_STATUS, self._get_device_status)
+        app.router.add_post(API_DEVICE_STATUS, self._post_device_status)
+        app.router.add_get(API_SETTINGS, self._get_settings)
+        app.router.add_post(API_SETTINGS, self._post_settings)
+        app.router.add_get(API_SCHEDULES, self._get_schedules)
+        app.router.add_post(API_SCHEDULES, self._post_schedules)
+        app.router.add_get(API_METRICS_PRESENCE, self._get_presence)
+        app.router.add_get(API_VITALS, self._get_vitals)
+        app.router.add_get(API_VITALS_SUMMARY, self._get_vitals_summary)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        await self._runner.cleanup()
+
+    def _in_window(self, windows: list[tuple[float, float]]) -> bool:
+        minute = self.elapsed_secs / 60
+        return any(start <= minute < end for start, end in windows)
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        key = f"{request.method} {request.path}"
+        self.request_counts[key] = self.request_counts.get(key, 0) + 1
+        if request.transport not in self._transports:
+            self._transports.add(request.transport)
+            self.connections += 1
+        if self._in_window(self.config.outages):
+            await asyncio.sleep(3600)
+        jitter = self._random.uniform(-self.config.jitter_ms, self.config.jitter_ms)
+        latency_ms = self.config.latency_ms + (self.config.vitals_latency_ms if request.path == API_VITALS else 0.0)
+        await asyncio.sleep(max(0.0, latency_ms + jitter) / 1000)
+        if self._random.random() < self.config.failure_rate:
+            raise web.HTTPInternalServerError()
+        self._advance()
+        response = await handler(request)
+        self.bytes_sent += len(response.body)
+        return response
+
+    def _advance(self) -> None:
+        elapsed = self.elapsed_secs
+        step = elapsed - self._advanced_at
+        self._advanced_at = elapsed
+        for side in ("left", "right"):
+            status = self.device_status[side]
+            status["secondsRemaining"] = max(0, int(8 * 3600 - elapsed))
+            drift = status["targetTemperatureF"] - status["currentTemperatureF"]
+            if drift and step >= 30:
+                status["currentTemperatureF"] += 1 if drift > 0 else -1
+        while self._next_vitals_at <= elapsed:
+            if self._in_window(self.config.presence_schedule):
+                for side in ("left", "right"):
+                    self._vitals_id += 1
+                    when = dt_util.utcnow()
+                    self.vitals[side].append((when, {
+                        "id": self._vitals_id,
+                        "side": side,
+                        "timestamp": _iso(when),
+                        "heart_rate": self._random.randint(50, 70),
+                        "hrv": self._random.randint(30, 80),
+                        "breathing_rate": self._random.randint(12, 18),
+                    }))
+            self._next_vitals_at += self.config.vitals_sample_secs
+
+    def _vitals_in_range(self, request: web.Request) -> list[dict[str, Any]]:
+        start = datetime.fromisoformat(request.query["startTime"])
+        end = datetime.fromisoformat(request.query["endTime"])
+        return [record for when, record in self.vitals[request.query["side"]] if start <= when <= end]
+
+    async def _get_device_status(self, request: web.Request) -> web.Response:
+        return web.json_response(self.device_status)
+
+    async def _post_device_status(self, request: web.Request) -> web.Response:
+        deep_merge(self.device_status, await request.json())
+        return web.json_response({})
+
+    async def _get_settings(self, request: web.Request) -> web.Response:
+        return web.json_response(self.settings)
+
+    async def _post_settings(self, request: web.Request) -> web.Response:
+        deep_merge(self.settings, await request.json())
+        return web.json_response({})
+
+    async def _get_schedules(self, request: web.Request) -> web.Response:
+        return web.json_response(self.schedules)
+
+    async def _post_schedules(self, request: web.Request) -> web.Response:
+        deep_merge(self.schedules, await request.json())
+        return web.json_response({})
+
+    async def _get_presence(self, request: web.Request) -> web.Response:
+        present = self._in_window(self.config.presence_schedule)
+        now = _iso(dt_util.utcnow())
+        return web.json_response({side: {"present": present, "lastUpdatedAt": now} for side in ("left", "right")})
+
+    async def _get_vitals(self, request: web.Request) -> web.Response:
+        return web.json_response(self._vitals_in_range(request))
+
+    async def _get_vitals_summary(self, request: web.Request) -> web.Response:
+        records = self._vitals_in_range(request)
+        if not records:
+            return web.json_response({})
+        heart_rates = [r["heart_rate"] for r in records]
+        return web.json_response({
+            "avgHeartRate": round(sum(heart_rates) / len(records)),
+            "minHeartRate": min(heart_rates),
+            "maxHeartRate": max(heart_rates),
+            "avgHRV": round(sum(r["hrv"] for r in records) / len(records)),
+            "avgBreathingRate": round(sum(r["breathing_rate"] for r in records) / len(records)),
+        })
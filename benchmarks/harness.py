@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import importlib
+import tempfile
+import types
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import event as event_helper
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util import dt as dt_util
+
+import custom_components.free_sleep as integration
+from custom_components.free_sleep import FreeSleepCoordinator, FreeSleepPresenceCoordinator
+from custom_components.free_sleep.const import CONF_BASE_URL, CONF_PORT, DOMAIN
+from custom_components.free_sleep.coordinator import FreeSleepClient
+
+
+class VirtualTimeLoop(asyncio.SelectorEventLoop):
+    def __init__(self) -> None:
+        super().__init__()
+        self._virtual_now = super().time()
+        self._started_at = self._virtual_now
+        self._wall_started_at = datetime.now(timezone.utc)
+
+    def time(self) -> float:
+        return self._virtual_now
+
+    def utcnow(self) -> datetime:
+        return self._wall_started_at + timedelta(seconds=self._virtual_now - self._started_at)
+
+    def _run_once(self) -> None:
+        if not self._ready and self._scheduled:
+            self._process_events(self._selector.select(0.001))
+            pending = [handle._when for handle in self._scheduled if not handle._cancelled]
+            if not self._ready and pending:
+                self._virtual_now = max(self._virtual_now, min(pending))
+        super()._run_once()
+
+
+def run_virtual(main: Callable[[], Any]) -> Any:
+    loop = VirtualTimeLoop()
+    asyncio.set_event_loop(loop)
+    utcnow = dt_util.utcnow
+    tracker_time, tracker_utcnow, tracker_timestamp = (
+        event_helper.time, event_helper.time_tracker_utcnow, event_helper.time_tracker_timestamp
+    )
+    timestamp = lambda: loop.utcnow().timestamp()
+    dt_util.utcnow = event_helper.time_tracker_utcnow = loop.utcnow
+    event_helper.time = types.SimpleNamespace(time=timestamp)
+    event_helper.time_tracker_timestamp = timestamp
+    try:
+        return loop.run_until_complete(main())
+    finally:
+        dt_util.utcnow = utcnow
+        event_helper.time, event_helper.time_tracker_utcnow, event_helper.time_tracker_timestamp = (
+            tracker_time, tracker_utcnow, tracker_timestamp
+        )
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.close()
+
+
+class BenchEntry:
+    def __init__(self, port: int, options: dict[str, Any], entry_id: str = "benchmark") -> None:
+        self.entry_id = entry_id
+        self.title = "Free Sleep (benchmark)"
+        self.data = {CONF_BASE_URL: "http://127.0.0.1", CONF_PORT: port}
+        self.options = options
+        self._on_unload: list[Callable[[], Any]] = []
+
+    def async_on_unload(self, func: Callable[[], Any]) -> None:
+        self._on_unload.append(func)
+
+    def add_update_listener(self, listener: Callable[..., Any]) -> Callable[[], None]:
+        return lambda: None
+
+    def async_run_unload_callbacks(self) -> None:
+        while self._on_unload:
+            self._on_unload.pop()()
+
+
+class BenchConfigEntries:
+    def __init__(self) -> None:
+        self.entries: dict[str, BenchEntry] = {}
+        self.pods: dict[str, Pod] = {}
+
+    def async_entries(self, domain: str | None = None) -> list[BenchEntry]:
+        return list(self.entries.values())
+
+    async def async_forward_entry_setups(self, entry: BenchEntry, platforms: list[str]) -> None:
+        await self.pods[entry.entry_id].async_setup_platforms(platforms)
+
+    async def async_unload_platforms(self, entry: BenchEntry, platforms: list[str]) -> bool:
+        await self.pods[entry.entry_id].async_unload_platforms()
+        return True
+
+
+@contextlib.contextmanager
+def _patched(module: Any, **attrs: Any):
+    saved = {name: getattr(module, name) for name in attrs}
+    for name, value in attrs.items():
+        setattr(module, name, value)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(module, name, value)
+
+
+class Pod:
+    def __init__(self, hass: HomeAssistant, entry: BenchEntry, shared_session: bool = False) -> None:
+        self.hass = hass
+        self.entry = entry
+        self.shared_session = shared_session
+        self.client: FreeSleepClient | None = None
+        self.coordinator: FreeSleepCoordinator | None = None
+        self.presence_coordinator: FreeSleepPresenceCoordinator | None = None
+        self.snapshot: Any = None
+        self.entities: list[Any] = []
+        self.state_writes = 0
+        self.recorder_rows = 0
+        self._published: dict[int, tuple[Any, ...]] = {}
+        self._setup_started = 0.0
+        self.setup_secs: float | None = None
+        self.restored = False
+        self.vitals_ready_secs: float | None = None
+        self.refresh_secs: dict[str, list[float]] = {"coordinator": [], "presence": []}
+        self.refresh_starts: dict[str, list[float]] = {"coordinator": [], "presence": []}
+        hass.config_entries.entries[entry.entry_id] = entry
+        hass.config_entries.pods[entry.entry_id] = self
+
+    def _instrument(self, coordinator: Any, name: str) -> None:
+        update = coordinator._async_update_data
+        loop = self.hass.loop
+        samples = self.refresh_secs[name]
+        starts = self.refresh_starts[name]
+
+        async def timed_update():
+            start = loop.time()
+            starts.append(start)
+            try:
+                return await update()
+            finally:
+                samples.append(loop.time() - start)
+
+        coordinator._async_update_data = timed_update
+
+    def _create_client(self, hass: HomeAssistant, entry: BenchEntry, **kwargs: Any) -> FreeSleepClient:
+        session = async_get_clientsession(hass) if self.shared_session else None
+        self.client = FreeSleepClient(hass, entry, session=session, **kwargs)
+        return self.client
+
+    def _create_presence_coordinator(self, *args: Any, **kwargs: Any) -> FreeSleepPresenceCoordinator:
+        self.presence_coordinator = FreeSleepPresenceCoordinator(*args, **kwargs)
+        self.snapshot = self.presence_coordinator.snapshot
+        self._instrument(self.presence_coordinator, "presence")
+        return self.presence_coordinator
+
+    def _create_coordinator(self, *args: Any, **kwargs: Any) -> FreeSleepCoordinator:
+        coordinator = self.coordinator = FreeSleepCoordinator(*args, **kwargs)
+        self._instrument(coordinator, "coordinator")
+        start_vitals = coordinator.async_start_vitals
+        loop = self.hass.loop
+
+        def async_start_vitals() -> asyncio.Task:
+            task = start_vitals()
+            task.add_done_callback(lambda _: setattr(self, "vitals_ready_secs", loop.time() - self._setup_started))
+            return task
+
+        coordinator.async_start_vitals = async_start_vitals
+        return coordinator
+
+    async def async_setup(self) -> None:
+        loop = self.hass.loop
+        self._setup_started = loop.time()
+        with _patched(
+            integration,
+            FreeSleepClient=self._create_client,
+            FreeSleepCoordinator=self._create_coordinator,
+            FreeSleepPresenceCoordinator=self._create_presence_coordinator,
+        ):
+            await integration.async_setup_entry(self.hass, self.entry)
+        self.setup_secs = loop.time() - self._setup_started
+
+    async def async_setup_platforms(self, platforms: list[str]) -> None:
+        self.restored = self.coordinator.stale
+        for platform in platforms:
+            module = importlib.import_module(f"custom_components.free_sleep.{platform}")
+            await module.async_setup_entry(self.hass, self.entry, self.entities.extend)
+        for entity in self.entities:
+            if not entity.entity_registry_enabled_default:
+                continue
+            entity.hass = self.hass
+            entity.async_write_ha_state = functools.partial(self._count_write, entity)
+            await entity.async_added_to_hass()
+
+    async def async_unload_platforms(self) -> None:
+        for entity in self.entities:
+            if entity.entity_registry_enabled_default:
+                await entity.async_will_remove_from_hass()
+                entity._call_on_remove_callbacks()
+
+    def _count_write(self, entity: Any) -> None:
+        self.state_writes += 1
+        published = (entity.available, entity.state, entity.state_attributes, entity.extra_state_attributes)
+        if self._published.get(id(entity)) != published:
+            self._published[id(entity)] = published
+            self.recorder_rows += 1
+
+    async def async_unload(self) -> None:
+        await integration.async_unload_entry(self.hass, self.entry)
+        self.entry.async_run_unload_callbacks()
+
+
+async def create_hass() -> HomeAssistant:
+    hass = HomeAssistant(tempfile.mkdtemp(prefix="free_sleep_bench_"))
+    hass.config_entries = BenchConfigEntries()
+    return hass
+
+
+def percentile(samples: list[float], pct: float) -> float | None:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def max_per_window(timestamps: list[float], window_secs: float) -> int:
+    ordered = sorted(timestamps)
+    best = 0
+    head = 0
+    for tail, when in enumerate(ordered):
+        while when - ordered[head] >= window_secs:
+            head += 1
+        best = max(best, tail - head + 1)
+    return best
@@ -1,104 +1,653 @@
 from __future__ import annotations
 import asyncio
+import copy
 import logging
-from datetime import timedelta
+import math
+import time
+from datetime import datetime, timedelta
+from typing import Any, Iterable
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 from .const import (
-    DOMAIN, API_DEVICE_STATUS, API_SETTINGS, API_METRICS_PRESENCE, PLATFORMS,
-    UPDATE_INTERVAL_SECS_DEFAULT, PRESENCE_UPDATE_INTERVAL_SECS,
-    CONF_VITALS_WINDOW_HOURS, DEFAULT_VITALS_WINDOW_HOURS,
+    DOMAIN, API_DEVICE_STATUS, API_SETTINGS, API_METRICS_PRESENCE, API_SCHEDULES, PLATFORMS,
+    UPDATE_INTERVAL_SECS_DEFAULT, SETTINGS_UPDATE_INTERVAL_SECS_DEFAULT, VITALS_UPDATE_INTERVAL_SECS_DEFAULT,
+    SCHEDULES_UPDATE_INTERVAL_SECS,
+    CONF_DEVICE_STATUS_INTERVAL_SECS, CONF_SETTINGS_INTERVAL_SECS, CONF_VITALS_INTERVAL_SECS,
+    PRESENCE_UPDATE_INTERVAL_SECS, PRESENCE_MAX_INTERVAL_SECS_DEFAULT, PRESENCE_BACKOFF_FACTOR,
+    PRESENCE_ENTER_DEBOUNCE_SECS_DEFAULT, PRESENCE_EXIT_DEBOUNCE_SECS_DEFAULT,
+    CONF_PRESENCE_MIN_INTERVAL_SECS, CONF_PRESENCE_MAX_INTERVAL_SECS,
+    CONF_PRESENCE_ENTER_DEBOUNCE_SECS, CONF_PRESENCE_EXIT_DEBOUNCE_SECS,
+    ENDPOINT_TIMEOUT_SECS, WRITE_COALESCE_WINDOW_SECS, WRITE_CONFIRM_TIMEOUT_SECS, WRITE_ENDPOINTS, WRITE_REFRESH_TIERS,
+    POST_WRITE_REFRESH_DELAY_SECS,
+    CONF_VITALS_WINDOW_HOURS, DEFAULT_VITALS_WINDOW_HOURS, VITALS_HISTORY_CAPACITY,
+    SCHEDULER_MAX_IN_FLIGHT, SCHEDULER_JITTER_FRACTION, SCHEDULER_MAX_JITTER_SECS,
+    SNAPSHOT_SAVE_DELAY_SECS, SNAPSHOT_SECTIONS,
+    CONF_SESSION_END_GAP_SECS, CONF_SESSION_MIN_SECS, SESSION_END_GAP_SECS_DEFAULT, SESSION_MIN_SECS_DEFAULT,
+    DEADLINE_DRIFT_TOLERANCE_SECS,
 )
+from .breaker import CircuitOpenError
 from .coordinator import FreeSleepClient
+from .dispatch import changed_paths, flatten_paths
+from .models import DecodedSections, DeviceStatus, Presence, Settings, VitalsSummary, vitals_by_side
+from .presence import PresenceFilter
+from .scheduler import PollJob, PollScheduler
+from .services import async_setup_services, async_unload_services
+from .sessions import SESSION_END, SleepSessionTracker, as_utc
+from .snapshot import SnapshotStore
+from .vitals import RollingVitalsWindow
+from .writes import CoalescingWriteQueue, PendingWrite, deep_merge, diff_payload
 
 _LOGGER = logging.getLogger(__name__)
 
+def _get_scheduler(hass: HomeAssistant) -> PollScheduler:
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "scheduler" not in domain_data:
+        domain_data["scheduler"] = PollScheduler(
+            hass, SCHEDULER_MAX_IN_FLIGHT, SCHEDULER_JITTER_FRACTION, SCHEDULER_MAX_JITTER_SECS
+        )
+    return domain_data["scheduler"]
+
+def _release_scheduler(hass: HomeAssistant) -> None:
+    if hass.data[DOMAIN]["scheduler"].idle:
+        hass.data[DOMAIN].pop("scheduler")
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    client = FreeSleepClient(hass, entry)
-    coordinator = FreeSleepCoordinator(hass, client, entry)
-    presence_coordinator = FreeSleepPresenceCoordinator(hass, client)
-    await coordinator.async_config_entry_first_refresh()
-    await presence_coordinator.async_config_entry_first_refresh()
+    client = FreeSleepClient(hass, entry, scheduler=_get_scheduler(hass))
+    snapshot = SnapshotStore(hass, entry.entry_id, SNAPSHOT_SAVE_DELAY_SECS)
+    presence_coordinator = FreeSleepPresenceCoordinator(hass, client, entry, snapshot=snapshot)
+    coordinator = FreeSleepCoordinator(hass, client, entry, snapshot=snapshot, sessions=presence_coordinator.sessions)
+    restored = await snapshot.async_load()
+    if restored:
+        presence_coordinator.async_restore_sessions(restored.get("sessions"), snapshot.restored_from)
+    if restored and coordinator.async_restore(restored):
+        presence_coordinator.async_restore(restored.get("presence"))
+    else:
+        restored = None
+        results = await asyncio.gather(
+            coordinator.async_config_entry_first_refresh(),
+            presence_coordinator.async_config_entry_first_refresh(),
+            return_exceptions=True,
+        )
+        if errors := [result for result in results if isinstance(result, BaseException)]:
+            await client.async_close()
+            _release_scheduler(hass)
+            raise errors[0]
     coordinator.start_polling()
+    presence_coordinator.start_polling()
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
         "client": client,
         "coordinator": coordinator,
         "presence_coordinator": presence_coordinator,
+        "snapshot": snapshot,
     }
+
+    async def _async_close_client(_event: Event) -> None:
+        await client.async_close()
+
+    entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_client))
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    async_setup_services(hass)
+    if restored:
+        coordinator.track_task(hass.async_create_background_task(
+            _async_reconcile(coordinator, presence_coordinator), "free_sleep snapshot reconcile"
+        ))
+    coordinator.async_start_vitals()
     return True
 
+async def _async_reconcile(
+    coordinator: FreeSleepCoordinator, presence_coordinator: FreeSleepPresenceCoordinator
+) -> None:
+    await asyncio.gather(coordinator.async_refresh(), presence_coordinator.async_refresh())
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    coordinator: FreeSleepCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    presence_coordinator: FreeSleepPresenceCoordinator = hass.data[DOMAIN][entry.entry_id]["presence_coordinator"]
-    coordinator.stop_polling()
-    await presence_coordinator.async_shutdown()
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        data = hass.data[DOMAIN].pop(entry.entry_id)
+        await data["presence_coordinator"].async_shutdown()
+        await data["coordinator"].async_shutdown()
+        _release_scheduler(hass)
+        await data["snapshot"].async_flush()
+        await data["client"].async_close()
+        async_unload_services(hass)
     return unload_ok
 
+async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await hass.config_entries.async_reload(entry.entry_id)
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await SnapshotStore(hass, entry.entry_id, SNAPSHOT_SAVE_DELAY_SECS).async_remove()
+
 class FreeSleepCoordinator(DataUpdateCoordinator):
-    def __init__(self, hass: HomeAssistant, client: FreeSleepClient, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: FreeSleepClient,
+        entry: ConfigEntry,
+        snapshot: SnapshotStore | None = None,
+        sessions: dict[str, SleepSessionTracker] | None = None,
+    ) -> None:
         self.client = client
         self.entry = entry
-        self.data = {}
-        self._poll_interval_seconds = int(UPDATE_INTERVAL_SECS_DEFAULT)
-        self._scheduled_refresh_task: asyncio.Task | None = None
+        self.snapshot = snapshot
+        self.sessions = sessions
+        self.stale_sections: set[str] = set()
+        self.deadline_resyncs = 0
+        self.writes = CoalescingWriteQueue(hass, client, WRITE_COALESCE_WINDOW_SECS)
+        self.pending_writes: list[PendingWrite] = []
+        self.writes_in_flight = 0
+        self.suppressed_writes = 0
+        self.write_latency_ms: float | None = None
+        self._confirmed_data: dict[str, Any] = {}
+        self._poll_job: PollJob | None = None
+        self._requested_tiers: set[str] = set()
+        self._requested_refresh_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._tier_due_at: dict[str, float] = {tier: 0.0 for tier in ENDPOINT_TIMEOUT_SECS}
+        self._tier_due_at["vitals"] = math.inf
+        self.endpoint_latency_ms: dict[str, float] = {}
+        self.vitals_windows: dict[str, RollingVitalsWindow] = {}
+        self._dispatched_sections: dict[str, tuple[Any, dict[str, Any]]] = {}
+        self._dispatched_success = True
+        self._dispatched_stale: set[str] = set()
+        self._decoded = DecodedSections()
         super().__init__(hass, _LOGGER, name="Free Sleep Coordinator", update_interval=None)
+        self.data = {}
+
+    @property
+    def device_status(self) -> DeviceStatus:
+        return self._decoded.get("device_status", self.data.get("device_status"), DeviceStatus.from_dict)
+
+    @property
+    def deadlines(self) -> dict[str, datetime | None]:
+        return self.data.get("deadlines") or {}
+
+    @property
+    def settings(self) -> Settings:
+        return self._decoded.get("settings", self.data.get("settings"), Settings.from_dict)
+
+    @property
+    def vitals(self) -> dict[str, VitalsSummary]:
+        return self._decoded.get("vitals", self.data.get("vitals"), vitals_by_side)
+
+    @property
+    def schedules(self) -> dict[str, Any]:
+        return self.data.get("schedules") or {}
+
+    @property
+    def stale(self) -> bool:
+        return bool(self.stale_sections)
+
+    @property
+    def tier_intervals(self) -> dict[str, int]:
+        options = self.entry.options
+        return {
+            "device_status": int(options.get(CONF_DEVICE_STATUS_INTERVAL_SECS, UPDATE_INTERVAL_SECS_DEFAULT)),
+            "settings": int(options.get(CONF_SETTINGS_INTERVAL_SECS, SETTINGS_UPDATE_INTERVAL_SECS_DEFAULT)),
+            "vitals": int(options.get(CONF_VITALS_INTERVAL_SECS, VITALS_UPDATE_INTERVAL_SECS_DEFAULT)),
+            "schedules": SCHEDULES_UPDATE_INTERVAL_SECS,
+        }
+
+    @property
+    def _poll_interval_seconds(self) -> int:
+        return min(self.tier_intervals.values())
 
     def start_polling(self) -> None:
-        self._schedule_delayed_refresh(self._poll_interval_seconds)
+        self._poll_job = self.client.scheduler.register(
+            self.entry.entry_id, "coordinator", self.async_refresh, lambda: self._poll_interval_seconds
+        )
 
     def stop_polling(self) -> None:
-        if self._scheduled_refresh_task and not self._scheduled_refresh_task.done():
-            self._scheduled_refresh_task.cancel()
+        if self._poll_job:
+            self.client.scheduler.unregister(self._poll_job)
+            self._poll_job = None
+        if self._requested_refresh_handle:
+            self._requested_refresh_handle.cancel()
+            self._requested_refresh_handle = None
+
+    async def async_shutdown(self) -> None:
+        self.stop_polling()
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.writes.async_shutdown()
+        await super().async_shutdown()
+
+    @callback
+    def track_task(self, task: asyncio.Task) -> asyncio.Task:
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
 
-    def defer_refresh(self) -> None:
-        self._schedule_delayed_refresh(self._poll_interval_seconds)
+    @callback
+    def request_refresh(self, endpoints: Iterable[str]) -> None:
+        self._requested_tiers.update(endpoints)
+        if self._requested_refresh_handle is None:
+            self._requested_refresh_handle = self.hass.loop.call_later(
+                POST_WRITE_REFRESH_DELAY_SECS, self._start_requested_refresh
+            )
 
-    def _schedule_delayed_refresh(self, delay_seconds: int) -> None:
-        if self._scheduled_refresh_task and not self._scheduled_refresh_task.done():
-            self._scheduled_refresh_task.cancel()
-        self._scheduled_refresh_task = self.hass.async_create_task(self._delayed_refresh(delay_seconds))
-        self._scheduled_refresh_task.add_done_callback(self._handle_scheduled_done)
+    @callback
+    def _start_requested_refresh(self) -> None:
+        self._requested_refresh_handle = None
+        tiers = self._requested_tiers
+        self._requested_tiers = set()
+        self.track_task(self.hass.async_create_task(self._async_refresh_tiers(tiers)))
 
-    async def _delayed_refresh(self, delay_seconds: int) -> None:
-        await asyncio.sleep(delay_seconds)
-        await super().async_refresh()
-        self._schedule_delayed_refresh(self._poll_interval_seconds)
+    @callback
+    def async_restore(self, sections: dict[str, Any]) -> bool:
+        if not isinstance(sections.get("device_status"), dict) or not isinstance(sections.get("settings"), dict):
+            return False
+        self._confirmed_data = {key: sections[key] for key in SNAPSHOT_SECTIONS if key in sections}
+        self.stale_sections = set(self._confirmed_data)
+        self.data = dict(self._confirmed_data)
+        return True
 
-    def _handle_scheduled_done(self, task: asyncio.Task) -> None:
-        if task.cancelled():
+    @callback
+    def async_start_vitals(self) -> asyncio.Task:
+        return self.track_task(
+            self.hass.async_create_background_task(self._async_load_vitals(), "free_sleep vitals backfill")
+        )
+
+    async def _async_load_vitals(self) -> None:
+        self.data, failed_tiers = await self._fetch_tiers({"vitals"})
+        self._tier_due_at["vitals"] = 0.0 if failed_tiers else self.hass.loop.time() + self.tier_intervals["vitals"]
+        self.async_update_listeners()
+
+    async def _async_refresh_tiers(self, tiers: set[str]) -> None:
+        try:
+            self.data, _ = await self._fetch_tiers(tiers)
+        except Exception as err:
+            _LOGGER.warning(
+                "Requested refresh failed service=free_sleep tiers=%s error=%r", ",".join(sorted(tiers)), err
+            )
             return
-        task.result()
+        self.async_update_listeners()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        start = time.perf_counter()
+        changed: set[str] = set()
+        sections: dict[str, tuple[Any, dict[str, Any]]] = {}
+        for key, section in self.data.items():
+            previous = self._dispatched_sections.get(key)
+            if previous is not None and previous[0] is section:
+                sections[key] = previous
+                continue
+            flat = flatten_paths(section, f"{key}.") if isinstance(section, dict) else {key: section}
+            changed |= changed_paths(previous[1] if previous else {}, flat)
+            sections[key] = (section, flat)
+        for key in self._dispatched_sections.keys() - sections.keys():
+            changed |= changed_paths(self._dispatched_sections[key][1], {})
+        for key in self._dispatched_stale ^ self.stale_sections:
+            if key in sections:
+                changed |= changed_paths(sections[key][1], {})
+        availability_changed = self.last_update_success != self._dispatched_success
+        self._dispatched_sections = sections
+        self._dispatched_success = self.last_update_success
+        self._dispatched_stale = set(self.stale_sections)
+        for update_callback, depends_on in list(self._listeners.values()):
+            if availability_changed or depends_on is None or not changed.isdisjoint(depends_on):
+                update_callback()
+        self.client.telemetry.record_timing("listener_dispatch", (time.perf_counter() - start) * 1000)
+
+    async def async_write(self, data_key: str, payload: dict[str, Any]) -> None:
+        if data_key not in self.stale_sections:
+            payload = diff_payload(self.data.get(data_key) or {}, payload)
+            if not payload:
+                self.suppressed_writes += 1
+                _LOGGER.debug("Write matches current state, skipping service=free_sleep endpoint=%s", data_key)
+                return
+        pending = PendingWrite(data_key, payload, self.hass.loop.time() + WRITE_CONFIRM_TIMEOUT_SECS)
+        self._supersede_pending(pending)
+        self.pending_writes.append(pending)
+        self._publish()
+        self.writes_in_flight += 1
+        start = self.hass.loop.time()
+        try:
+            await self.writes.submit(WRITE_ENDPOINTS[data_key], payload)
+        except Exception as err:
+            if pending in self.pending_writes:
+                self.pending_writes.remove(pending)
+            _LOGGER.warning("Write failed, rolling back service=free_sleep endpoint=%s error=%r", data_key, err)
+            raise
+        finally:
+            self.writes_in_flight -= 1
+            self.write_latency_ms = round((self.hass.loop.time() - start) * 1000, 1)
+            self._publish()
+        pending.acknowledged = True
+        self.request_refresh(endpoints=WRITE_REFRESH_TIERS[data_key])
+
+    async def async_apply_state(self, payloads: dict[str, dict[str, Any]]) -> None:
+        await asyncio.gather(*(self.async_write(key, payload) for key, payload in payloads.items() if payload))
+
+    @callback
+    def _publish(self) -> None:
+        self.data = self._apply_pending(self._confirmed_data)
+        self.async_update_listeners()
+
+    def _supersede_pending(self, newer: PendingWrite) -> None:
+        for pending in list(self.pending_writes):
+            if pending.data_key == newer.data_key and not pending.supersede(newer.expected):
+                self.pending_writes.remove(pending)
 
-    def _schedule_refresh(self) -> None:
-        super()._schedule_refresh()
+    def _apply_pending(self, confirmed: dict[str, Any]) -> dict[str, Any]:
+        data = dict(confirmed)
+        for pending in self.pending_writes:
+            data[pending.data_key] = deep_merge(copy.deepcopy(data[pending.data_key]), pending.payload)
+        return data
+
+    def _reconcile_pending(self, now: float) -> None:
+        for pending in list(self.pending_writes):
+            if pending.acknowledged and pending.confirmed_by(self._confirmed_data[pending.data_key]):
+                self.pending_writes.remove(pending)
+            elif now >= pending.deadline:
+                self.pending_writes.remove(pending)
+                _LOGGER.warning(
+                    "Write not confirmed before deadline, rolling back service=free_sleep endpoint=%s payload=%s",
+                    pending.data_key, pending.payload,
+                )
+
+    async def _timed_fetch(self, name: str, timeout_key: str, coro) -> Any:
+        start = self.hass.loop.time()
+        try:
+            async with asyncio.timeout(ENDPOINT_TIMEOUT_SECS[timeout_key]):
+                return await coro
+        except TimeoutError:
+            self.client.breaker.record_failure()
+            raise
+        finally:
+            self.endpoint_latency_ms[name] = round((self.hass.loop.time() - start) * 1000, 1)
 
     async def _async_update_data(self):
-        device_status = await self.client.get(API_DEVICE_STATUS)
-        settings = await self.client.get(API_SETTINGS)
+        if self.client.breaker.is_open:
+            return self._unreachable(self.data)
+        now = self.hass.loop.time()
+        horizon = now + self._poll_interval_seconds / 2
+        due_tiers = {tier for tier, due_at in self._tier_due_at.items() if horizon >= due_at}
+        data, failed_tiers = await self._fetch_tiers(due_tiers)
+        if self.client.breaker.is_open:
+            return self._unreachable(data)
+        intervals = self.tier_intervals
+        for tier in due_tiers - failed_tiers:
+            self._tier_due_at[tier] = now + intervals[tier]
+        if "schedules" in failed_tiers:
+            self._tier_due_at["schedules"] = now + intervals["settings"]
+        return data
+
+    def _unreachable(self, data: dict[str, Any]) -> dict[str, Any]:
+        if not self.stale:
+            raise UpdateFailed(f"Pod unreachable, retrying in {self.client.breaker.retry_in_secs}s")
+        _LOGGER.debug("Pod unreachable, keeping restored snapshot service=free_sleep stale=%s", sorted(self.stale_sections))
+        return data
+
+    async def _fetch_tiers(self, tiers: set[str]) -> tuple[dict[str, Any], set[str]]:
+        start = self.hass.loop.time()
+        try:
+            return await self._fetch_tiers_inner(tiers)
+        finally:
+            self.client.telemetry.record_timing("refresh", (self.hass.loop.time() - start) * 1000)
+
+    async def _fetch_tiers_inner(self, tiers: set[str]) -> tuple[dict[str, Any], set[str]]:
         hours = int(self.entry.options.get(CONF_VITALS_WINDOW_HOURS, DEFAULT_VITALS_WINDOW_HOURS))
-        v_left = await self.client.get_vitals_summary("left", hours)
-        v_right = await self.client.get_vitals_summary("right", hours)
-        return {
-            "device_status": device_status,
-            "settings": settings,
-            "vitals": {"left": v_left, "right": v_right, "window_hours": hours},
+        window_hours = hours or DEFAULT_VITALS_WINDOW_HOURS
+        wall_now = dt_util.utcnow()
+        for side in ("left", "right"):
+            if side not in self.vitals_windows or self.vitals_windows[side].window_hours != window_hours:
+                self.vitals_windows[side] = RollingVitalsWindow(window_hours, VITALS_HISTORY_CAPACITY)
+        endpoints = {
+            "device_status": ("device_status", lambda: self.client.get(API_DEVICE_STATUS)),
+            "settings": ("settings", lambda: self.client.get(API_SETTINGS)),
+            "schedules": ("schedules", lambda: self.client.get(API_SCHEDULES)),
+            "vitals_left": ("vitals", lambda: self._fetch_vitals("left", wall_now)),
+            "vitals_right": ("vitals", lambda: self._fetch_vitals("right", wall_now)),
         }
+        fetches = {name: (tier, fetch) for name, (tier, fetch) in endpoints.items() if tier in tiers}
+        results = await asyncio.gather(
+            *(self._timed_fetch(name, tier, fetch()) for name, (tier, fetch) in fetches.items()),
+            return_exceptions=True,
+        )
+        fetched = dict(zip(fetches, results))
+        _LOGGER.debug(
+            "Refresh complete service=free_sleep tiers=%s %s",
+            ",".join(sorted(tiers)),
+            " ".join(f"{name}_ms={self.endpoint_latency_ms[name]}" for name in fetched),
+        )
+        data = dict(self._confirmed_data)
+        if "device_status" in fetched:
+            data["device_status"] = self._resolve_fetch("device_status", fetched["device_status"])
+            if data["device_status"] is not self._confirmed_data.get("device_status"):
+                data["deadlines"] = self._resolve_deadlines(data["device_status"], dt_util.utcnow())
+        if "settings" in fetched:
+            data["settings"] = self._resolve_fetch("settings", fetched["settings"])
+            previous = self._confirmed_data.get("settings")
+            if previous is not None and data["settings"] is not previous and "schedules" not in tiers:
+                _LOGGER.debug("Settings changed, scheduling schedules refresh service=free_sleep")
+                self._tier_due_at["schedules"] = 0.0
+        if "schedules" in fetched:
+            if isinstance(fetched["schedules"], BaseException):
+                _LOGGER.debug(
+                    "Schedules fetch failed, keeping previous schedules service=free_sleep error=%r", fetched["schedules"]
+                )
+            else:
+                data["schedules"] = fetched["schedules"]
+        if "vitals" in tiers:
+            results = (fetched["vitals_left"], fetched["vitals_right"])
+            for result in results:
+                self._log_vitals_failure(result)
+            if not all(isinstance(r, BaseException) for r in results):
+                data["vitals"] = {
+                    "left": self._vitals_summary("left", wall_now, hours),
+                    "right": self._vitals_summary("right", wall_now, hours),
+                    "window_hours": hours,
+                }
+        failed_tiers = {fetches[name][0] for name, result in fetched.items() if isinstance(result, BaseException)}
+        self._confirmed_data = data
+        self.stale_sections -= tiers - failed_tiers
+        if self.snapshot:
+            self.snapshot.async_update({key: data[key] for key in SNAPSHOT_SECTIONS if key in data})
+        self._reconcile_pending(self.hass.loop.time())
+        return self._apply_pending(data), failed_tiers
+
+    def _resolve_deadlines(self, device_status: dict[str, Any], now: datetime) -> dict[str, datetime | None]:
+        previous = self._confirmed_data.get("deadlines") or {}
+        status = self._decoded.get("device_status", device_status, DeviceStatus.from_dict)
+        deadlines: dict[str, datetime | None] = {}
+        for side in ("left", "right"):
+            remaining = status.side(side).seconds_remaining
+            current = previous.get(side)
+            if not remaining or remaining <= 0:
+                deadlines[side] = None
+                continue
+            deadline = now + timedelta(seconds=remaining)
+            if current is not None and abs((deadline - current).total_seconds()) <= DEADLINE_DRIFT_TOLERANCE_SECS:
+                deadline = current
+            elif current is not None:
+                self.deadline_resyncs += 1
+                _LOGGER.debug(
+                    "Timer drifted, resyncing deadline service=free_sleep side=%s drift_secs=%.1f",
+                    side, (deadline - current).total_seconds(),
+                )
+            deadlines[side] = deadline
+        return previous if deadlines == previous else deadlines
+
+    def _resolve_fetch(self, key: str, result: Any) -> Any:
+        if not isinstance(result, BaseException):
+            return result
+        if key not in self._confirmed_data:
+            raise UpdateFailed(f"Fetching {key} failed: {result!r}") from result
+        _LOGGER.warning("Endpoint fetch failed, keeping previous data service=free_sleep endpoint=%s error=%r", key, result)
+        return self._confirmed_data[key]
+
+    def _vitals_summary(self, side: str, now: datetime, hours: int) -> dict[str, Any]:
+        span = self.sessions[side].span(now.timestamp()) if not hours and self.sessions else None
+        return self.vitals_windows[side].summary(now, span)
+
+    async def _fetch_vitals(self, side: str, now: datetime) -> None:
+        window = self.vitals_windows[side]
+        records = await self.client.get_vitals(side, window.fetch_start(now), now)
+        window.ingest(records)
+        window.evict(now)
+
+    def _log_vitals_failure(self, result: Any) -> None:
+        if isinstance(result, BaseException):
+            _LOGGER.debug("Vitals fetch failed, keeping previous window service=free_sleep error=%r", result)
 
 class FreeSleepPresenceCoordinator(DataUpdateCoordinator):
-    def __init__(self, hass: HomeAssistant, client: FreeSleepClient) -> None:
+    def __init__(
+        self, hass: HomeAssistant, client: FreeSleepClient, entry: ConfigEntry, snapshot: SnapshotStore | None = None
+    ) -> None:
         self.client = client
+        self.entry = entry
+        self.snapshot = snapshot
+        self.stale = False
         self.data = {}
-        super().__init__(
-            hass,
-            _LOGGER,
-            name="Free Sleep Presence Coordinator",
-            update_interval=timedelta(seconds=PRESENCE_UPDATE_INTERVAL_SECS),
+        self.filters = {"left": PresenceFilter(), "right": PresenceFilter()}
+        self.sessions = {side: SleepSessionTracker() for side in self.filters}
+        self._dispatched: tuple[Any, bool, tuple[bool | None, ...], bool] | None = None
+        self._dispatched_sessions: dict[str, tuple[Any, ...]] = {}
+        self._decoded = DecodedSections()
+        self.poll_interval_secs = PRESENCE_UPDATE_INTERVAL_SECS
+        self._poll_job: PollJob | None = None
+        super().__init__(hass, _LOGGER, name="Free Sleep Presence Coordinator", update_interval=None)
+
+    def start_polling(self) -> None:
+        self._poll_job = self.client.scheduler.register(
+            self.entry.entry_id, "presence", self.async_refresh, lambda: self.poll_interval_secs
         )
 
+    def stop_polling(self) -> None:
+        if self._poll_job:
+            self.client.scheduler.unregister(self._poll_job)
+            self._poll_job = None
+
+    async def async_shutdown(self) -> None:
+        self.stop_polling()
+        await super().async_shutdown()
+
+    @property
+    def presence(self) -> Presence:
+        return self._decoded.get("presence", self.data, Presence.from_dict)
+
+    @callback
+    def async_restore(self, presence: dict[str, Any] | None) -> None:
+        if not isinstance(presence, dict):
+            return
+        self.data = presence
+        for side, presence_filter in self.filters.items():
+            presence_filter.state = presence_filter.raw = self.presence.side(side).present
+        self.stale = True
+
+    @callback
+    def async_restore_sessions(self, sessions: dict[str, Any] | None, saved_at: str | None) -> None:
+        if not isinstance(sessions, dict):
+            return
+        saved = dt_util.parse_datetime(saved_at) if saved_at else None
+        now = dt_util.utcnow().timestamp()
+        end_gap_secs, min_session_secs = self._session_options()
+        for side, tracker in self.sessions.items():
+            tracker.restore(sessions.get(side), saved.timestamp() if saved else None, now, end_gap_secs, min_session_secs)
+        if self.snapshot:
+            self.snapshot.async_update({"sessions": {side: tracker.as_dict() for side, tracker in self.sessions.items()}})
+
+    @callback
+    def async_update_listeners(self) -> None:
+        start = time.perf_counter()
+        states = tuple(presence_filter.state for presence_filter in self.filters.values())
+        dispatched = self._dispatched
+        availability_changed = dispatched is None or dispatched[1] != self.last_update_success or dispatched[3] != self.stale
+        presence_changed = availability_changed or dispatched[0] is not self.data or dispatched[2] != states
+        now = dt_util.utcnow().timestamp()
+        changed = {
+            f"sessions.{side}" for side, tracker in self.sessions.items()
+            if self._dispatched_sessions.get(side) != tracker.revision(now)
+        }
+        if not presence_changed and not changed:
+            return
+        self._dispatched = (self.data, self.last_update_success, states, self.stale)
+        self._dispatched_sessions = {side: tracker.revision(now) for side, tracker in self.sessions.items()}
+        for update_callback, depends_on in list(self._listeners.values()):
+            if availability_changed or (presence_changed if depends_on is None else not changed.isdisjoint(depends_on)):
+                update_callback()
+        self.client.telemetry.record_timing("presence_listener_dispatch", (time.perf_counter() - start) * 1000)
+
     async def _async_update_data(self):
-        return await self.client.get(API_METRICS_PRESENCE)
+        if self.client.breaker.is_open:
+            if self.stale:
+                return self.data
+            raise UpdateFailed(f"Pod unreachable, retrying in {self.client.breaker.retry_in_secs}s")
+        start = self.hass.loop.time()
+        try:
+            presence = await self.client.get(API_METRICS_PRESENCE)
+        except Exception as err:
+            if self.stale:
+                _LOGGER.debug("Presence fetch failed, keeping restored snapshot service=free_sleep error=%r", err)
+                return self.data
+            if isinstance(err, CircuitOpenError):
+                raise UpdateFailed(str(err)) from err
+            raise
+        finally:
+            self.client.telemetry.record_timing("presence_refresh", (self.hass.loop.time() - start) * 1000)
+        self.stale = False
+        if self.snapshot:
+            self.snapshot.async_update({"presence": presence})
+        options = self.entry.options
+        enter_secs = float(options.get(CONF_PRESENCE_ENTER_DEBOUNCE_SECS, PRESENCE_ENTER_DEBOUNCE_SECS_DEFAULT))
+        exit_secs = float(options.get(CONF_PRESENCE_EXIT_DEBOUNCE_SECS, PRESENCE_EXIT_DEBOUNCE_SECS_DEFAULT))
+        now = self.hass.loop.time()
+        decoded = self._decoded.get("presence", presence, Presence.from_dict)
+        raw_changed = False
+        for side, presence_filter in self.filters.items():
+            raw_changed |= presence_filter.observe(decoded.side(side).present, now, enter_secs, exit_secs)
+        self._adapt_interval(raw_changed or any(f.pending for f in self.filters.values()))
+        self._track_sessions(dt_util.utcnow().timestamp())
+        return presence
+
+    def _session_options(self) -> tuple[float, float]:
+        options = self.entry.options
+        return (
+            float(options.get(CONF_SESSION_END_GAP_SECS, SESSION_END_GAP_SECS_DEFAULT)),
+            float(options.get(CONF_SESSION_MIN_SECS, SESSION_MIN_SECS_DEFAULT)),
+        )
+
+    def _track_sessions(self, now: float) -> None:
+        end_gap_secs, min_session_secs = self._session_options()
+        changed = False
+        for side, tracker in self.sessions.items():
+            if kind := tracker.observe(self.filters[side].state, now, end_gap_secs, min_session_secs):
+                self._fire_session_event(side, kind, tracker, now)
+                changed = True
+        if changed and self.snapshot:
+            self.snapshot.async_update({"sessions": {side: tracker.as_dict() for side, tracker in self.sessions.items()}})
+
+    def _fire_session_event(self, side: str, kind: str, tracker: SleepSessionTracker, now: float) -> None:
+        if kind == SESSION_END:
+            session = tracker.last_session
+            data = {
+                "started_at": as_utc(session["started_at"]).isoformat(),
+                "ended_at": as_utc(session["ended_at"]).isoformat(),
+                "time_in_bed_secs": round(session["in_bed_secs"]),
+                "exits": session["exits"],
+            }
+        else:
+            data = {
+                "at": as_utc(now).isoformat(),
+                "session_started_at": as_utc(tracker.started_at).isoformat(),
+                "time_in_bed_secs": round(tracker.time_in_bed_secs(now)),
+                "exits": tracker.exits,
+            }
+        _LOGGER.debug("Sleep session event service=free_sleep side=%s kind=%s exits=%s", side, kind, data["exits"])
+        self.hass.bus.async_fire(f"{DOMAIN}_{kind}", {"entry_id": self.entry.entry_id, "side": side, **data})
+
+    def _adapt_interval(self, active: bool) -> None:
+        options = self.entry.options
+        floor = float(options.get(CONF_PRESENCE_MIN_INTERVAL_SECS, PRESENCE_UPDATE_INTERVAL_SECS))
+        ceiling = float(options.get(CONF_PRESENCE_MAX_INTERVAL_SECS, PRESENCE_MAX_INTERVAL_SECS_DEFAULT))
+        if active:
+            self.poll_interval_secs = floor
+        else:
+            self.poll_interval_secs = min(ceiling, self.poll_interval_secs * PRESENCE_BACKOFF_FACTOR)
@@ -8,25 +8,16 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from . import FreeSleepCoordinator
-
-def _resolve_side_name(settings: dict, side: str) -> str:
-    try:
-        name = (settings or {}).get(side, {}).get("name")
-        if isinstance(name, str) and name.strip():
-            return name.strip()
-    except Exception:
-        pass
-    return side.capitalize()
+from .publish import GatedPublishMixin
+from . import FreeSleepCoordinator, FreeSleepPresenceCoordinator
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator: FreeSleepCoordinator = data["coordinator"]
     presence_coordinator = data["presence_coordinator"]
-    settings = coordinator.data.get("settings") or {}
-    left_name = _resolve_side_name(settings, "left")
-    right_name = _resolve_side_name(settings, "right")
+    left_name = coordinator.settings.side_name("left")
+    right_name = coordinator.settings.side_name("right")
 
     entities = [
         WaterLevelOKBinary(coordinator, entry),
@@ -38,18 +29,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     ]
     async_add_entities(entities)
 
-def _parse_bool(val) -> bool:
-    if isinstance(val, bool):
-        return val
-    if isinstance(val, str):
-        return val.lower() == "true"
-    return bool(val)
-
 class HubBaseEntity(CoordinatorEntity, BinarySensorEntity):
+    _depends_on: tuple[str, ...]
+
     def __init__(self, coordinator: FreeSleepCoordinator, entry: ConfigEntry):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=self._depends_on)
         self._entry = entry
 
+    @property
+    def extra_state_attributes(self):
+        return {"stale": "device_status" in self.coordinator.stale_sections}
+
     @property
     def device_info(self):
         return {
@@ -62,6 +52,7 @@ class WaterLevelOKBinary(HubBaseEntity):
     _attr_name = "Water Level Problem"
     _attr_unique_id_suffix = "water_level_ok"
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    _depends_on = ("device_status.waterLevel",)
 
     @property
     def unique_id(self):
@@ -69,18 +60,16 @@ class WaterLevelOKBinary(HubBaseEntity):
 
     @property
     def is_on(self) -> bool | None:
-        val = self.coordinator.data["device_status"].get("waterLevel")
-        ok = _parse_bool(val)
-        return not ok
+        return not self.coordinator.device_status.water_level_ok
 
     @property
     def extra_state_attributes(self):
-        val = self.coordinator.data["device_status"].get("waterLevel")
-        return {"raw_waterLevel": val}
+        return {**super().extra_state_attributes, "raw_waterLevel": self.coordinator.device_status.raw_water_level}
 
 class IsPrimingBinary(HubBaseEntity):
     _attr_name = "Priming"
     _attr_unique_id_suffix = "is_priming"
+    _depends_on = ("device_status.isPriming",)
 
     @property
     def unique_id(self):
@@ -88,11 +77,11 @@ class IsPrimingBinary(HubBaseEntity):
 
     @property
     def is_on(self) -> bool | None:
-        return _parse_bool(self.coordinator.data["device_status"].get("isPriming"))
+        return self.coordinator.device_status.is_priming
 
 class SideAlarmBinary(CoordinatorEntity, BinarySensorEntity):
     def __init__(self, coordinator: FreeSleepCoordinator, entry: ConfigEntry, side: str, side_name: str):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(f"device_status.{side}.isAlarmVibrating",))
         self._entry = entry
         self._side = side
         self._side_name = side_name
@@ -101,8 +90,11 @@ class SideAlarmBinary(CoordinatorEntity, BinarySensorEntity):
 
     @property
     def is_on(self) -> bool | None:
-        side = self.coordinator.data["device_status"].get(self._side, {})
-        return bool(side.get("isAlarmVibrating"))
+        return self.coordinator.device_status.side(self._side).is_alarm_vibrating
+
+    @property
+    def extra_state_attributes(self):
+        return {"stale": "device_status" in self.coordinator.stale_sections}
 
     @property
     def device_info(self):
@@ -113,10 +105,10 @@ class SideAlarmBinary(CoordinatorEntity, BinarySensorEntity):
             "via_device": (DOMAIN, f"{self._entry.entry_id}_hub"),
         }
 
-class SidePresenceBinary(CoordinatorEntity, BinarySensorEntity):
+class SidePresenceBinary(GatedPublishMixin, CoordinatorEntity, BinarySensorEntity):
     _attr_device_class = BinarySensorDeviceClass.PRESENCE
 
-    def __init__(self, coordinator: FreeSleepCoordinator, entry: ConfigEntry, side: str, side_name: str):
+    def __init__(self, coordinator: FreeSleepPresenceCoordinator, entry: ConfigEntry, side: str, side_name: str):
         super().__init__(coordinator)
         self._entry = entry
         self._side = side
@@ -126,11 +118,18 @@ class SidePresenceBinary(CoordinatorEntity, BinarySensorEntity):
 
     @property
     def is_on(self) -> bool | None:
-        return self.coordinator.data[self._side]["present"]
+        return self.coordinator.filters[self._side].state
+
+    def _publish_key(self):
+        presence_filter = self.coordinator.filters[self._side]
+        return presence_filter.state, presence_filter.raw, self.coordinator.stale
 
     @property
     def extra_state_attributes(self):
-        return {"last_updated_at": self.coordinator.data[self._side]["lastUpdatedAt"]}
+        return {
+            "raw_present": self.coordinator.filters[self._side].raw,
+            "stale": self.coordinator.stale,
+        }
 
     @property
     def device_info(self):
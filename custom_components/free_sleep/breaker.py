@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import logging
+import random
+from typing import Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class CircuitBreaker:
+    def __init__(
+        self, failure_threshold: int, base_backoff_secs: float, max_backoff_secs: float, clock: Callable[[], float]
+    ) -> None:
+        self._clock = clock
+        self._failure_threshold = failure_threshold
+        self._base_backoff_secs = base_backoff_secs
+        self._max_backoff_secs = max_backoff_secs
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self.trips = 0
+        self.open_until = 0.0
+        self._open_streak = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == STATE_OPEN and self._clock() < self.open_until
+
+    @property
+    def retry_in_secs(self) -> float | None:
+        if self.state != STATE_OPEN:
+            return None
+        return round(max(0.0, self.open_until - self._clock()), 1)
+
+    def begin_probe(self) -> None:
+        self.state = STATE_HALF_OPEN
+
+    def record_success(self) -> None:
+        if self.state != STATE_CLOSED:
+            _LOGGER.info("Pod reachable again, closing circuit service=free_sleep trips=%s", self.trips)
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self._open_streak = 0
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        if self.state == STATE_OPEN:
+            return
+        if self.state == STATE_HALF_OPEN or self.consecutive_failures >= self._failure_threshold:
+            self._open()
+
+    def _open(self) -> None:
+        backoff = min(self._max_backoff_secs, self._base_backoff_secs * 2 ** self._open_streak)
+        backoff = random.uniform(backoff / 2, backoff)
+        self._open_streak += 1
+        self.trips += 1
+        self.state = STATE_OPEN
+        self.open_until = self._clock() + backoff
+        _LOGGER.warning(
+            "Pod unreachable, opening circuit service=free_sleep failures=%s retry_in=%.1f",
+            self.consecutive_failures, backoff,
+        )
@@ -17,7 +17,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 
 class PrimeNowButton(CoordinatorEntity, ButtonEntity):
     def __init__(self, coordinator: FreeSleepCoordinator, entry: ConfigEntry):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=())
         self._entry = entry
         self._attr_name = "Free Sleep Prime Now"
         self._attr_unique_id = f"{entry.entry_id}_prime_button"
@@ -31,5 +31,5 @@ class PrimeNowButton(CoordinatorEntity, ButtonEntity):
         }
 
     async def async_press(self) -> None:
-        await self.coordinator.client.post(API_DEVICE_STATUS, {"isPriming": True})
-        self.coordinator.defer_refresh()
+        await self.coordinator.writes.submit(API_DEVICE_STATUS, {"isPriming": True})
+        self.coordinator.request_refresh(endpoints=("device_status",))
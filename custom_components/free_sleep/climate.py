@@ -1,7 +1,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import Any
 
 from homeassistant.components.climate import ClimateEntity
@@ -16,28 +15,18 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, API_DEVICE_STATUS
+from .const import DOMAIN, MIN_TEMPERATURE_F, MAX_TEMPERATURE_F
 from . import FreeSleepCoordinator
 
 
-def _resolve_side_name(settings: dict, side: str) -> str:
-    try:
-        name = (settings or {}).get(side, {}).get("name")
-        if isinstance(name, str) and name.strip():
-            return name.strip()
-    except Exception:
-        pass
-    return side.capitalize()
-
-
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator: FreeSleepCoordinator = data["coordinator"]
-    settings = coordinator.data.get("settings") or {}
+    settings = coordinator.settings
 
     entities = [
-        FreeSleepSideClimate(coordinator, entry, side="left", side_name=_resolve_side_name(settings, "left")),
-        FreeSleepSideClimate(coordinator, entry, side="right", side_name=_resolve_side_name(settings, "right")),
+        FreeSleepSideClimate(coordinator, entry, side="left", side_name=settings.side_name("left")),
+        FreeSleepSideClimate(coordinator, entry, side="right", side_name=settings.side_name("right")),
     ]
     async_add_entities(entities)
 
@@ -48,13 +37,21 @@ class FreeSleepSideClimate(CoordinatorEntity, ClimateEntity):
     _attr_icon = "mdi:thermostat"
 
     def __init__(self, coordinator: FreeSleepCoordinator, entry: ConfigEntry, side: str, side_name: str):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(
+            f"device_status.{side}.currentTemperatureF",
+            f"device_status.{side}.targetTemperatureF",
+            f"device_status.{side}.isOn",
+        ))
         self._entry = entry
         self._side = side
         self._side_name = side_name
         self._attr_name = f"{side_name} Climate"
         self._attr_unique_id = f"{entry.entry_id}_{side}_climate"
 
+    @property
+    def extra_state_attributes(self):
+        return {"stale": "device_status" in self.coordinator.stale_sections}
+
     @property
     def device_info(self):
         return {
@@ -66,21 +63,19 @@ class FreeSleepSideClimate(CoordinatorEntity, ClimateEntity):
 
     @property
     def current_temperature(self) -> float | None:
-        side = self.coordinator.data["device_status"].get(self._side, {})
-        return side.get("currentTemperatureF")
+        return self.coordinator.device_status.side(self._side).current_temperature_f
 
     @property
     def target_temperature(self) -> float | None:
-        side = self.coordinator.data["device_status"].get(self._side, {})
-        return side.get("targetTemperatureF")
+        return self.coordinator.device_status.side(self._side).target_temperature_f
 
     @property
     def min_temp(self) -> float:
-        return 55.0
+        return MIN_TEMPERATURE_F
 
     @property
     def max_temp(self) -> float:
-        return 115.0
+        return MAX_TEMPERATURE_F
 
     @property
     def target_temperature_step(self) -> float:
@@ -88,11 +83,10 @@ class FreeSleepSideClimate(CoordinatorEntity, ClimateEntity):
 
     @property
     def hvac_action(self) -> HVACAction | None:
-        side = self.coordinator.data["device_status"].get(self._side, {})
-        is_on = side.get("isOn")
-        cur = side.get("currentTemperatureF")
-        tgt = side.get("targetTemperatureF")
-        if not is_on or cur is None or tgt is None:
+        side = self.coordinator.device_status.side(self._side)
+        cur = side.current_temperature_f
+        tgt = side.target_temperature_f
+        if not side.is_on or cur is None or tgt is None:
             return HVACAction.IDLE
         if cur < tgt:
             return HVACAction.HEATING
@@ -102,20 +96,12 @@ class FreeSleepSideClimate(CoordinatorEntity, ClimateEntity):
 
     @property
     def hvac_mode(self) -> HVACMode:
-        side = self.coordinator.data["device_status"].get(self._side, {})
-        return HVACMode.HEAT_COOL if side.get("isOn") else HVACMode.OFF
+        return HVACMode.HEAT_COOL if self.coordinator.device_status.side(self._side).is_on else HVACMode.OFF
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
-        is_on = hvac_mode != HVACMode.OFF
-        self.coordinator.data["device_status"][self._side]["isOn"] = is_on
-        self.async_write_ha_state()
-        asyncio.create_task(self.coordinator.client.post(API_DEVICE_STATUS, {self._side: {"isOn": is_on}}))
-        self.coordinator.defer_refresh()
+        await self.coordinator.async_write("device_status", {self._side: {"isOn": hvac_mode != HVACMode.OFF}})
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         if (temp := kwargs.get(ATTR_TEMPERATURE)) is None:
             return
-        self.coordinator.data["device_status"][self._side]["targetTemperatureF"] = temp
-        self.async_write_ha_state()
-        asyncio.create_task(self.coordinator.client.post(API_DEVICE_STATUS, {self._side: {"targetTemperatureF": temp}}))
-        self.coordinator.defer_refresh()
\ No newline at end of file
+        await self.coordinator.async_write("device_status", {self._side: {"targetTemperatureF": temp}})
\ No newline at end of file
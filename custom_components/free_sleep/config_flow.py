@@ -3,12 +3,37 @@ import voluptuous as vol
 from typing import Any
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult, OptionsFlow
 from homeassistant.core import callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from .const import (
     DOMAIN, CONF_BASE_URL, CONF_PORT, DEFAULT_PORT,
     CONF_VITALS_WINDOW_HOURS, DEFAULT_VITALS_WINDOW_HOURS,
+    CONF_DEVICE_STATUS_INTERVAL_SECS, CONF_SETTINGS_INTERVAL_SECS, CONF_VITALS_INTERVAL_SECS,
+    UPDATE_INTERVAL_SECS_DEFAULT, SETTINGS_UPDATE_INTERVAL_SECS_DEFAULT, VITALS_UPDATE_INTERVAL_SECS_DEFAULT,
+    CONF_PRESENCE_MIN_INTERVAL_SECS, CONF_PRESENCE_MAX_INTERVAL_SECS,
+    CONF_PRESENCE_ENTER_DEBOUNCE_SECS, CONF_PRESENCE_EXIT_DEBOUNCE_SECS,
+    PRESENCE_UPDATE_INTERVAL_SECS, PRESENCE_MAX_INTERVAL_SECS_DEFAULT,
+    PRESENCE_ENTER_DEBOUNCE_SECS_DEFAULT, PRESENCE_EXIT_DEBOUNCE_SECS_DEFAULT,
+    CONF_SESSION_END_GAP_SECS, CONF_SESSION_MIN_SECS, SESSION_END_GAP_SECS_DEFAULT, SESSION_MIN_SECS_DEFAULT,
+    CONF_SECONDS_REMAINING_QUANTUM_SECS, CONF_MIN_PUBLISH_INTERVAL_SECS,
+    SECONDS_REMAINING_QUANTUM_SECS_DEFAULT, MIN_PUBLISH_INTERVAL_SECS_DEFAULT,
 )
 from .coordinator import FreeSleepClient
 
+OPTION_FIELDS = {
+    CONF_VITALS_WINDOW_HOURS: (int, DEFAULT_VITALS_WINDOW_HOURS, 0, 168),
+    CONF_DEVICE_STATUS_INTERVAL_SECS: (int, UPDATE_INTERVAL_SECS_DEFAULT, 1, 300),
+    CONF_SETTINGS_INTERVAL_SECS: (int, SETTINGS_UPDATE_INTERVAL_SECS_DEFAULT, 5, 3600),
+    CONF_VITALS_INTERVAL_SECS: (int, VITALS_UPDATE_INTERVAL_SECS_DEFAULT, 30, 3600),
+    CONF_PRESENCE_MIN_INTERVAL_SECS: (float, PRESENCE_UPDATE_INTERVAL_SECS, 0.25, 60.0),
+    CONF_PRESENCE_MAX_INTERVAL_SECS: (float, PRESENCE_MAX_INTERVAL_SECS_DEFAULT, 0.25, 300.0),
+    CONF_PRESENCE_ENTER_DEBOUNCE_SECS: (float, PRESENCE_ENTER_DEBOUNCE_SECS_DEFAULT, 0.0, 60.0),
+    CONF_PRESENCE_EXIT_DEBOUNCE_SECS: (float, PRESENCE_EXIT_DEBOUNCE_SECS_DEFAULT, 0.0, 600.0),
+    CONF_SESSION_END_GAP_SECS: (float, SESSION_END_GAP_SECS_DEFAULT, 60.0, 14400.0),
+    CONF_SESSION_MIN_SECS: (float, SESSION_MIN_SECS_DEFAULT, 0.0, 14400.0),
+    CONF_SECONDS_REMAINING_QUANTUM_SECS: (int, SECONDS_REMAINING_QUANTUM_SECS_DEFAULT, 1, 3600),
+    CONF_MIN_PUBLISH_INTERVAL_SECS: (float, MIN_PUBLISH_INTERVAL_SECS_DEFAULT, 0.0, 3600.0),
+}
+
 class FreeSleepConfigFlow(ConfigFlow, domain=DOMAIN):
     VERSION = 1
 
@@ -17,7 +42,9 @@ class FreeSleepConfigFlow(ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             base_url = user_input[CONF_BASE_URL].rstrip("/")
             port = user_input.get(CONF_PORT, DEFAULT_PORT)
-            client = FreeSleepClient(self.hass, None, base_url=base_url, port=port)
+            client = FreeSleepClient(
+                self.hass, None, base_url=base_url, port=port, session=async_get_clientsession(self.hass)
+            )
             try:
                 await client.get("/api/deviceStatus")
             except Exception:
@@ -28,7 +55,7 @@ class FreeSleepConfigFlow(ConfigFlow, domain=DOMAIN):
                 return self.async_create_entry(
                     title=f"Free Sleep ({base_url}:{port})",
                     data={CONF_BASE_URL: base_url, CONF_PORT: port},
-                    options={CONF_VITALS_WINDOW_HOURS: DEFAULT_VITALS_WINDOW_HOURS},
+                    options={key: default for key, (_, default, _, _) in OPTION_FIELDS.items()},
                 )
         data_schema = vol.Schema({
             vol.Required(CONF_BASE_URL, description={"suggested_value": "http://localhost"}): str,
@@ -49,10 +76,19 @@ class FreeSleepOptionsFlowHandler(OptionsFlow):
         return await self.async_step_window()
 
     async def async_step_window(self, user_input=None):
+        errors: dict[str, str] = {}
         if user_input is not None:
-            hours = int(user_input.get(CONF_VITALS_WINDOW_HOURS, DEFAULT_VITALS_WINDOW_HOURS))
-            hours = max(1, min(hours, 168))
-            return self.async_create_entry(title="", data={CONF_VITALS_WINDOW_HOURS: hours})
-        current = self.config_entry.options.get(CONF_VITALS_WINDOW_HOURS, DEFAULT_VITALS_WINDOW_HOURS)
-        schema = vol.Schema({ vol.Required(CONF_VITALS_WINDOW_HOURS, default=current): int })
-        return self.async_show_form(step_id="window", data_schema=schema)
+            options = {
+                key: max(low, min(kind(user_input[key]), high))
+                for key, (kind, _, low, high) in OPTION_FIELDS.items()
+            }
+            if options[CONF_PRESENCE_MIN_INTERVAL_SECS] > options[CONF_PRESENCE_MAX_INTERVAL_SECS]:
+                errors["base"] = "presence_interval_range"
+            else:
+                return self.async_create_entry(title="", data=options)
+        options = user_input or self.config_entry.options
+        schema = vol.Schema({
+            vol.Required(key, default=options.get(key, default)): vol.Coerce(kind)
+            for key, (kind, default, _, _) in OPTION_FIELDS.items()
+        })
+        return self.async_show_form(step_id="window", data_schema=schema, errors=errors)
@@ -5,14 +5,107 @@ CONF_PORT = "port"
 
 API_DEVICE_STATUS = "/api/deviceStatus"
 API_SETTINGS = "/api/settings"
-API_VITALS_SUMMARY = "/api/metrics/vitals/summary"
+API_VITALS = "/api/metrics/vitals"
 API_METRICS_PRESENCE = "/api/metrics/presence"
+API_SCHEDULES = "/api/schedules"
 
 PLATFORMS = ["climate", "binary_sensor", "sensor", "button", "switch"]
 
 UPDATE_INTERVAL_SECS_DEFAULT = 5
+SETTINGS_UPDATE_INTERVAL_SECS_DEFAULT = 60
+VITALS_UPDATE_INTERVAL_SECS_DEFAULT = 300
+SCHEDULES_UPDATE_INTERVAL_SECS = 6 * 3600
+
+CONF_DEVICE_STATUS_INTERVAL_SECS = "device_status_interval_secs"
+CONF_SETTINGS_INTERVAL_SECS = "settings_interval_secs"
+CONF_VITALS_INTERVAL_SECS = "vitals_interval_secs"
+
+WRITE_COALESCE_WINDOW_SECS = 0.25
+WRITE_CONFIRM_TIMEOUT_SECS = 30
+POST_WRITE_REFRESH_DELAY_SECS = 1.0
+
+WRITE_ENDPOINTS = {
+    "device_status": API_DEVICE_STATUS,
+    "settings": API_SETTINGS,
+}
+
+SERVICE_APPLY_STATE = "apply_state"
+MIN_TEMPERATURE_F = 55.0
+MAX_TEMPERATURE_F = 115.0
+
+WRITE_REFRESH_TIERS = {
+    "device_status": ("device_status",),
+    "settings": ("settings", "schedules"),
+}
+
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_BASE_BACKOFF_SECS = 2.0
+BREAKER_MAX_BACKOFF_SECS = 300.0
+BREAKER_PROBE_TIMEOUT_SECS = 2.0
+
+ENDPOINT_TIMEOUT_SECS = {
+    "device_status": 4,
+    "settings": 4,
+    "vitals": 8,
+    "schedules": 4,
+}
 
 PRESENCE_UPDATE_INTERVAL_SECS = 0.5
+PRESENCE_MAX_INTERVAL_SECS_DEFAULT = 2.0
+PRESENCE_BACKOFF_FACTOR = 1.5
+PRESENCE_ENTER_DEBOUNCE_SECS_DEFAULT = 1.0
+PRESENCE_EXIT_DEBOUNCE_SECS_DEFAULT = 10.0
+
+CONF_PRESENCE_MIN_INTERVAL_SECS = "presence_min_interval_secs"
+CONF_PRESENCE_MAX_INTERVAL_SECS = "presence_max_interval_secs"
+CONF_PRESENCE_ENTER_DEBOUNCE_SECS = "presence_enter_debounce_secs"
+CONF_PRESENCE_EXIT_DEBOUNCE_SECS = "presence_exit_debounce_secs"
 
 CONF_VITALS_WINDOW_HOURS = "vitals_window_hours"
 DEFAULT_VITALS_WINDOW_HOURS = 24
+
+TELEMETRY_LATENCY_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+CLIENT_REQUEST_TIMEOUT_SECS = 10
+CLIENT_CONNECTION_LIMIT = 5
+CLIENT_KEEPALIVE_SECS = 90
+CLIENT_DNS_CACHE_TTL_SECS = 300
+CLIENT_CACHE_TTL_SECS = {
+    API_SETTINGS: 2.0,
+    API_SCHEDULES: 2.0,
+}
+
+SCHEDULER_MAX_IN_FLIGHT = 8
+SCHEDULER_JITTER_FRACTION = 0.1
+SCHEDULER_MAX_JITTER_SECS = 2.0
+
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY_SECS = 60
+SNAPSHOT_SECTIONS = ("device_status", "settings", "vitals", "schedules")
+SNAPSHOT_VOLATILE_FIELDS = {
+    "device_status": ("secondsRemaining", "currentTemperatureF", "isAlarmVibrating"),
+    "presence": ("lastUpdatedAt",),
+}
+
+VITALS_HISTORY_DAYS = 7
+VITALS_HISTORY_SAMPLE_SECS = 60
+VITALS_HISTORY_CAPACITY = VITALS_HISTORY_DAYS * 86400 // VITALS_HISTORY_SAMPLE_SECS
+VITALS_TREND_WINDOW_SECS = 3600
+VITALS_TREND_MIN_SAMPLES = 3
+VITALS_TREND_MIN_SPAN_SECS = 900
+VITALS_RESTING_WINDOW_SECS = 1800
+VITALS_RESTING_MIN_SAMPLES = 10
+
+SESSION_END_GAP_SECS_DEFAULT = 1800.0
+SESSION_MIN_SECS_DEFAULT = 900.0
+CONF_SESSION_END_GAP_SECS = "session_end_gap_secs"
+CONF_SESSION_MIN_SECS = "session_min_secs"
+
+SECONDS_REMAINING_QUANTUM_SECS_DEFAULT = 60
+MIN_PUBLISH_INTERVAL_SECS_DEFAULT = 60.0
+CONF_SECONDS_REMAINING_QUANTUM_SECS = "seconds_remaining_quantum_secs"
+CONF_MIN_PUBLISH_INTERVAL_SECS = "min_publish_interval_secs"
+
+DEADLINE_DRIFT_TOLERANCE_SECS = 5.0
+
+SCHEDULE_LOOKAHEAD_DAYS = 8
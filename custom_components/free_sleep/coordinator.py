@@ -1,15 +1,33 @@
 from __future__ import annotations
+import asyncio
+import contextlib
+import hashlib
 import logging
 from typing import Any
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 from urllib.parse import urlparse
+import aiohttp
+import orjson
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from .const import CONF_BASE_URL, CONF_PORT, DEFAULT_PORT, API_VITALS_SUMMARY
+from .breaker import STATE_CLOSED, CircuitBreaker, CircuitOpenError
+from .scheduler import PollScheduler
+from .const import (
+    CONF_BASE_URL, CONF_PORT, DEFAULT_PORT, API_DEVICE_STATUS, API_SETTINGS, API_VITALS, API_METRICS_PRESENCE,
+    API_SCHEDULES,
+    BREAKER_FAILURE_THRESHOLD, BREAKER_BASE_BACKOFF_SECS, BREAKER_MAX_BACKOFF_SECS, BREAKER_PROBE_TIMEOUT_SECS,
+    TELEMETRY_LATENCY_BUCKETS_MS,
+    CLIENT_REQUEST_TIMEOUT_SECS, CLIENT_CONNECTION_LIMIT, CLIENT_KEEPALIVE_SECS, CLIENT_DNS_CACHE_TTL_SECS,
+    CLIENT_CACHE_TTL_SECS, SNAPSHOT_VOLATILE_FIELDS,
+)
+from .dispatch import without_fields
+from .telemetry import Telemetry
 
 _LOGGER = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_VOLATILE_FIELDS = {API_METRICS_PRESENCE: SNAPSHOT_VOLATILE_FIELDS["presence"]}
+
 def _normalize_base(base_url: str, port: int | None) -> str:
     if not base_url.startswith(("http://", "https://")):
         base_url = f"http://{base_url}"
@@ -30,38 +48,204 @@ def path_join(base: str, *parts: str) -> str:
     tail = "/".join(p.lstrip("/") for p in parts)
     return f"{base}/{tail}"
 
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task) -> None:
+        self.task = task
+        self.waiters = 0
+
 class FreeSleepClient:
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry | None, *, base_url: str | None=None, port: int | None=None):
+    def __init__(
+        self, hass: HomeAssistant, entry: ConfigEntry | None, *, base_url: str | None=None, port: int | None=None,
+        session: aiohttp.ClientSession | None = None, scheduler: PollScheduler | None = None,
+        cache_ttl_secs: dict[str, float] | None = None,
+    ):
         self._hass = hass
+        self.scheduler = scheduler
+        self._pod_id = entry.entry_id if entry else None
         if entry:
             raw_base = entry.data[CONF_BASE_URL]
             raw_port = entry.data.get(CONF_PORT, DEFAULT_PORT)
             self.base_url = _normalize_base(raw_base, raw_port)
         else:
             self.base_url = _normalize_base(base_url or "http://localhost", port or DEFAULT_PORT)
-        self._session = async_get_clientsession(hass)
+        self._owns_session = session is None
+        self._session = session or aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=CLIENT_CONNECTION_LIMIT,
+                keepalive_timeout=CLIENT_KEEPALIVE_SECS,
+                ttl_dns_cache=CLIENT_DNS_CACHE_TTL_SECS,
+            )
+        )
+        self._timeout = aiohttp.ClientTimeout(total=CLIENT_REQUEST_TIMEOUT_SECS)
+        self._probe_timeout = aiohttp.ClientTimeout(total=BREAKER_PROBE_TIMEOUT_SECS)
+        self._fingerprints: dict[str, tuple[bytes, Any]] = {}
+        self._cache_ttl_secs = CLIENT_CACHE_TTL_SECS if cache_ttl_secs is None else cache_ttl_secs
+        self._cache: dict[tuple[str, tuple], tuple[float, Any]] = {}
+        self._flights: dict[tuple[str, tuple], _Flight] = {}
+        self._urls = {
+            path: path_join(self.base_url, path)
+            for path in (API_DEVICE_STATUS, API_SETTINGS, API_VITALS, API_METRICS_PRESENCE, API_SCHEDULES)
+        }
+        self.breaker = CircuitBreaker(
+            BREAKER_FAILURE_THRESHOLD, BREAKER_BASE_BACKOFF_SECS, BREAKER_MAX_BACKOFF_SECS, hass.loop.time
+        )
+        self._probe_lock = asyncio.Lock()
+        self.telemetry = Telemetry(TELEMETRY_LATENCY_BUCKETS_MS)
+
+    async def async_close(self) -> None:
+        for flight in self._flights.values():
+            flight.task.cancel()
+        self._flights.clear()
+        if self._owns_session:
+            await self._session.close()
+
+    def _request_slot(self) -> contextlib.AbstractAsyncContextManager:
+        if self.scheduler is None:
+            return contextlib.nullcontext()
+        return self.scheduler.request_slot(self._pod_id)
+
+    def _url(self, path: str) -> str:
+        return self._urls.get(path) or path_join(self.base_url, path)
 
     async def get(self, path: str, params: dict[str, Any] | None = None) -> Any:
-        url = path_join(self.base_url, path)
-        async with self._session.get(url, timeout=10, params=params) as resp:
-            resp.raise_for_status()
-            return await resp.json()
+        key = (path, tuple(sorted(params.items())) if params else ())
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > self._hass.loop.time():
+            self.telemetry.record_collapsed(f"GET {path}", cached=True)
+            return cached[1]
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = self._flights[key] = _Flight(self._hass.loop.create_task(self._fetch(key, path, params)))
+        else:
+            self.telemetry.record_collapsed(f"GET {path}", cached=False)
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                flight.task.cancel()
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+
+    async def _fetch(self, key: tuple[str, tuple], path: str, params: dict[str, Any] | None) -> Any:
+        task = asyncio.current_task()
+        try:
+            result = await self._get(path, params)
+        finally:
+            flight = self._flights.get(key)
+            owned = flight is not None and flight.task is task
+            if owned:
+                del self._flights[key]
+        if owned and (ttl := self._cache_ttl_secs.get(path)):
+            self._cache[key] = (self._hass.loop.time() + ttl, result)
+        return result
+
+    def _invalidate(self, path: str) -> None:
+        for key in [key for key in (*self._cache, *self._flights) if key[0] == path]:
+            self._cache.pop(key, None)
+            self._flights.pop(key, None)
+
+    async def _get(self, path: str, params: dict[str, Any] | None) -> Any:
+        await self._guard()
+        url = self._url(path)
+        start = self._hass.loop.time()
+        received = 0
+        error = True
+        unchanged = False
+        try:
+            async with self._request_slot():
+                start = self._hass.loop.time()
+                async with self._session.get(url, timeout=self._timeout, params=params) as resp:
+                    resp.raise_for_status()
+                    body = await resp.read()
+            received = len(body)
+            if params is None:
+                result, unchanged = self._decode_fingerprinted(path, body)
+            else:
+                result = orjson.loads(body)
+            error = False
+        except (aiohttp.ClientConnectionError, TimeoutError):
+            self.breaker.record_failure()
+            raise
+        finally:
+            self.telemetry.record_request(
+                f"GET {path}", (self._hass.loop.time() - start) * 1000, received, error, unchanged
+            )
+        self.breaker.record_success()
+        return result
+
+    def _decode_fingerprinted(self, path: str, body: bytes) -> tuple[Any, bool]:
+        fingerprint = hashlib.blake2b(body, digest_size=16).digest()
+        cached = self._fingerprints.get(path)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1], True
+        result = orjson.loads(body)
+        fields = _VOLATILE_FIELDS.get(path)
+        if cached is not None and fields and without_fields(result, fields) == without_fields(cached[1], fields):
+            self._fingerprints[path] = (fingerprint, cached[1])
+            return cached[1], True
+        self._fingerprints[path] = (fingerprint, result)
+        return result, False
 
     async def post(self, path: str, payload: dict) -> Any:
-        url = path_join(self.base_url, path)
-        async with self._session.post(url, json=payload, timeout=10) as resp:
-            resp.raise_for_status()
-            try:
-                return await resp.json()
-            except Exception:
-                return None
-
-    async def get_vitals_summary(self, side: str, window_hours: int) -> dict[str, Any] | None:
-        now = datetime.now(timezone.utc)
-        start = now - timedelta(hours=window_hours)
-        params = {"startTime": iso_z(start), "endTime": iso_z(now), "side": side}
+        self._invalidate(path)
+        try:
+            return await self._post(path, payload)
+        finally:
+            self._invalidate(path)
+
+    async def _post(self, path: str, payload: dict) -> Any:
+        await self._guard()
+        url = self._url(path)
+        start = self._hass.loop.time()
+        received = 0
+        error = True
         try:
-            return await self.get(API_VITALS_SUMMARY, params=params)
-        except Exception as e:
-            _LOGGER.debug("Vitals fetch failed for %s: %s", side, e)
-            return None
+            async with self._request_slot():
+                start = self._hass.loop.time()
+                async with self._session.post(
+                    url, data=orjson.dumps(payload), headers=_JSON_HEADERS, timeout=self._timeout
+                ) as resp:
+                    resp.raise_for_status()
+                    body = await resp.read()
+            received = len(body)
+            try:
+                result = orjson.loads(body)
+            except orjson.JSONDecodeError:
+                result = None
+            error = False
+        except (aiohttp.ClientConnectionError, TimeoutError):
+            self.breaker.record_failure()
+            raise
+        finally:
+            self.telemetry.record_request(f"POST {path}", (self._hass.loop.time() - start) * 1000, received, error)
+        self.breaker.record_success()
+        return result
+
+    async def _guard(self) -> None:
+        if self.breaker.state == STATE_CLOSED:
+            return
+        if self.breaker.is_open:
+            raise CircuitOpenError(f"Circuit open for {self.base_url}, retry in {self.breaker.retry_in_secs}s")
+        async with self._probe_lock:
+            if self.breaker.state == STATE_CLOSED:
+                return
+            if self.breaker.is_open:
+                raise CircuitOpenError(f"Circuit open for {self.base_url}, retry in {self.breaker.retry_in_secs}s")
+            self.breaker.begin_probe()
+            try:
+                async with self._request_slot(), self._session.get(
+                    self._urls[API_METRICS_PRESENCE], timeout=self._probe_timeout
+                ) as resp:
+                    resp.raise_for_status()
+            except (aiohttp.ClientError, TimeoutError) as err:
+                self.breaker.record_failure()
+                raise CircuitOpenError(f"Probe to {self.base_url} failed: {err!r}") from err
+            self.breaker.record_success()
+
+    async def get_vitals(self, side: str, start: datetime, end: datetime) -> list[dict[str, Any]]:
+        params = {"startTime": iso_z(start), "endTime": iso_z(end), "side": side}
+        return await self.get(API_VITALS, params=params)
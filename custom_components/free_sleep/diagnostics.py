@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_BASE_URL, DOMAIN
+
+TO_REDACT = {CONF_BASE_URL}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    data = hass.data[DOMAIN][entry.entry_id]
+    client = data["client"]
+    coordinator = data["coordinator"]
+    presence_coordinator = data["presence_coordinator"]
+    breaker = client.breaker
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "connection": {
+            "state": breaker.state,
+            "consecutive_failures": breaker.consecutive_failures,
+            "trips": breaker.trips,
+            "retry_in_secs": breaker.retry_in_secs,
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "tier_intervals": coordinator.tier_intervals,
+            "pending_writes": len(coordinator.pending_writes),
+            "writes_in_flight": coordinator.writes_in_flight,
+            "suppressed_writes": coordinator.suppressed_writes,
+            "stale_sections": sorted(coordinator.stale_sections),
+            "deadlines": coordinator.deadlines,
+            "deadline_resyncs": coordinator.deadline_resyncs,
+        },
+        "presence_coordinator": {
+            "last_update_success": presence_coordinator.last_update_success,
+            "poll_interval_secs": presence_coordinator.poll_interval_secs,
+            "stale": presence_coordinator.stale,
+            "sessions": {side: tracker.as_dict() for side, tracker in presence_coordinator.sessions.items()},
+        },
+        "snapshot": data["snapshot"].as_dict(),
+        "scheduler": client.scheduler.as_dict(entry.entry_id),
+        "telemetry": client.telemetry.as_dict(),
+    }
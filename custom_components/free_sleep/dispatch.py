@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import Any
+
+_MISSING = object()
+
+
+def flatten_paths(data: dict[str, Any], prefix: str = "") -> dict[str, Any]:
+    flat: dict[str, Any] = {}
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten_paths(value, f"{path}."))
+        else:
+            flat[path] = value
+    return flat
+
+
+def without_fields(value: Any, fields: tuple[str, ...]) -> Any:
+    if not isinstance(value, dict):
+        return value
+    return {
+        name: {key: item[key] for key in item if key not in fields} if isinstance(item, dict) else item
+        for name, item in value.items()
+    }
+
+
+def expand_paths(flat: dict[str, Any]) -> dict[str, Any]:
+    data: dict[str, Any] = {}
+    for path, value in flat.items():
+        *parents, leaf = path.split(".")
+        node = data
+        for key in parents:
+            node = node.setdefault(key, {})
+        node[leaf] = value
+    return data
+
+
+def changed_paths(previous: dict[str, Any], current: dict[str, Any]) -> set[str]:
+    changed: set[str] = set()
+    for path in previous.keys() | current.keys():
+        if previous.get(path, _MISSING) != current.get(path, _MISSING):
+            parts = path.split(".")
+            changed.update(".".join(parts[:depth]) for depth in range(1, len(parts) + 1))
+    return changed
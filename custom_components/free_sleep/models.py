@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from homeassistant.util import dt as dt_util
+
+from .vitals import VITALS_FIELDS, VITALS_PERCENTILES
+
+
+def as_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.strip().lower() == "true"
+    return bool(value)
+
+
+def as_datetime(value: Any) -> datetime | None:
+    if not value or not isinstance(value, str):
+        return None
+    parsed = dt_util.parse_datetime(value)
+    if parsed is None:
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+@dataclass(slots=True)
+class SideStatus:
+    current_temperature_f: float | None
+    target_temperature_f: float | None
+    seconds_remaining: int | None
+    is_alarm_vibrating: bool
+    is_on: bool
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any] | None) -> SideStatus:
+        raw = raw or {}
+        return cls(
+            current_temperature_f=raw.get("currentTemperatureF"),
+            target_temperature_f=raw.get("targetTemperatureF"),
+            seconds_remaining=raw.get("secondsRemaining"),
+            is_alarm_vibrating=as_bool(raw.get("isAlarmVibrating")),
+            is_on=as_bool(raw.get("isOn")),
+        )
+
+
+@dataclass(slots=True)
+class DeviceStatus:
+    left: SideStatus
+    right: SideStatus
+    water_level_ok: bool
+    raw_water_level: Any
+    is_priming: bool
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any] | None) -> DeviceStatus:
+        raw = raw or {}
+        return cls(
+            left=SideStatus.from_dict(raw.get("left")),
+            right=SideStatus.from_dict(raw.get("right")),
+            water_level_ok=as_bool(raw.get("waterLevel")),
+            raw_water_level=raw.get("waterLevel"),
+            is_priming=as_bool(raw.get("isPriming")),
+        )
+
+    def side(self, side: str) -> SideStatus:
+        return self.left if side == "left" else self.right
+
+
+@dataclass(slots=True)
+class SideSettings:
+    name: str | None
+    away_mode: bool
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any] | None) -> SideSettings:
+        raw = raw or {}
+        name = raw.get("name")
+        return cls(
+            name=name.strip() if isinstance(name, str) and name.strip() else None,
+            away_mode=as_bool(raw.get("awayMode")),
+        )
+
+
+@dataclass(slots=True)
+class Settings:
+    left: SideSettings
+    right: SideSettings
+    link_both_sides: bool
+    last_prime: datetime | None
+    time_zone: str | None
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any] | None) -> Settings:
+        raw = raw or {}
+        return cls(
+            left=SideSettings.from_dict(raw.get("left")),
+            right=SideSettings.from_dict(raw.get("right")),
+            link_both_sides=as_bool(raw.get("linkBothSides")),
+            last_prime=as_datetime(raw.get("lastPrime")),
+            time_zone=raw.get("timeZone"),
+        )
+
+    def side(self, side: str) -> SideSettings:
+        return self.left if side == "left" else self.right
+
+    def side_name(self, side: str) -> str:
+        return self.side(side).name or side.capitalize()
+
+
+@dataclass(slots=True)
+class VitalsSummary:
+    avg_heart_rate: float | None
+    min_heart_rate: float | None
+    max_heart_rate: float | None
+    avg_hrv: float | None
+    min_hrv: float | None
+    max_hrv: float | None
+    avg_breathing_rate: float | None
+    min_breathing_rate: float | None
+    max_breathing_rate: float | None
+    p10_heart_rate: float | None
+    p50_heart_rate: float | None
+    p90_heart_rate: float | None
+    p10_hrv: float | None
+    p50_hrv: float | None
+    p90_hrv: float | None
+    p10_breathing_rate: float | None
+    p50_breathing_rate: float | None
+    p90_breathing_rate: float | None
+    trend_heart_rate: float | None
+    resting_heart_rate: float | None
+    window_hours: int | None
+    scope: str | None
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any] | None, window_hours: int | None) -> VitalsSummary:
+        raw = raw or {}
+        values = {
+            f"{stat}_{field}": raw.get(f"{stat}{name}")
+            for name, field in VITALS_FIELDS.items()
+            for stat in ("avg", "min", "max", *(f"p{pct}" for pct in VITALS_PERCENTILES))
+        }
+        return cls(
+            trend_heart_rate=raw.get("trendHeartRate"),
+            resting_heart_rate=raw.get("restingHeartRate"),
+            window_hours=window_hours,
+            scope=raw.get("scope"),
+            **values,
+        )
+
+    @staticmethod
+    def attribute(key: str) -> str:
+        name = next(name for name in VITALS_FIELDS if key.endswith(name))
+        return f"{key[:-len(name)]}_{VITALS_FIELDS[name]}"
+
+
+@dataclass(slots=True)
+class SidePresence:
+    present: bool
+    last_updated_at: datetime | None
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any] | None) -> SidePresence:
+        raw = raw or {}
+        return cls(present=as_bool(raw.get("present")), last_updated_at=as_datetime(raw.get("lastUpdatedAt")))
+
+
+@dataclass(slots=True)
+class Presence:
+    left: SidePresence
+    right: SidePresence
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any] | None) -> Presence:
+        raw = raw or {}
+        return cls(left=SidePresence.from_dict(raw.get("left")), right=SidePresence.from_dict(raw.get("right")))
+
+    def side(self, side: str) -> SidePresence:
+        return self.left if side == "left" else self.right
+
+
+def vitals_by_side(raw: dict[str, Any] | None) -> dict[str, VitalsSummary]:
+    raw = raw or {}
+    return {side: VitalsSummary.from_dict(raw.get(side), raw.get("window_hours")) for side in ("left", "right")}
+
+
+class DecodedSections:
+    __slots__ = ("_entries",)
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[Any, Any]] = {}
+
+    def get(self, key: str, section: Any, decode: Callable[[Any], Any]) -> Any:
+        cached = self._entries.get(key)
+        if cached is not None and cached[0] is section:
+            return cached[1]
+        model = decode(section)
+        self._entries[key] = (section, model)
+        return model
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+
+class PresenceFilter:
+    __slots__ = ("state", "raw", "_candidate", "_candidate_since")
+
+    def __init__(self) -> None:
+        self.state: bool | None = None
+        self.raw: bool | None = None
+        self._candidate: bool | None = None
+        self._candidate_since = 0.0
+
+    @property
+    def pending(self) -> bool:
+        return self._candidate is not None
+
+    def observe(self, present: bool, now: float, enter_secs: float, exit_secs: float) -> bool:
+        raw_changed = present != self.raw
+        self.raw = present
+        if self.state is None:
+            self.state = present
+            return raw_changed
+        if present == self.state:
+            self._candidate = None
+            return raw_changed
+        if self._candidate != present:
+            self._candidate = present
+            self._candidate_since = now
+        hold_secs = enter_secs if present else exit_secs
+        if now - self._candidate_since >= hold_secs:
+            self.state = present
+            self._candidate = None
+        return raw_changed
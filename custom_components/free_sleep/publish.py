@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import math
+from typing import Any, Hashable
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import CONF_MIN_PUBLISH_INTERVAL_SECS, MIN_PUBLISH_INTERVAL_SECS_DEFAULT
+
+
+def quantize(value: Any, quantum: float | None) -> Any:
+    if value is None or not quantum:
+        return value
+    return type(value)(math.ceil(value / quantum) * quantum)
+
+
+class PublishGate:
+    __slots__ = ("_available", "_key", "_published_at", "published", "suppressed")
+
+    def __init__(self) -> None:
+        self._available: bool | None = None
+        self._key: Hashable = None
+        self._published_at: float | None = None
+        self.published = 0
+        self.suppressed = 0
+
+    def allow(self, available: bool, key: Hashable, now: float, min_interval_secs: float) -> bool:
+        if self._published_at is not None and available == self._available:
+            if key == self._key or now - self._published_at < min_interval_secs:
+                self.suppressed += 1
+                return False
+        self._available = available
+        self._key = key
+        self._published_at = now
+        self.published += 1
+        return True
+
+    def retry_in(self, key: Hashable, now: float, min_interval_secs: float) -> float | None:
+        if self._published_at is None or key == self._key:
+            return None
+        return max(0.0, self._published_at + min_interval_secs - now)
+
+
+class GatedPublishMixin:
+    _rate_limited = False
+    _publish_gate: PublishGate | None = None
+    _publish_retry: CALLBACK_TYPE | None = None
+
+    def _publish_key(self) -> Hashable:
+        return self.state
+
+    def _min_publish_interval_secs(self) -> float:
+        if not self._rate_limited:
+            return 0.0
+        return float(self._entry.options.get(CONF_MIN_PUBLISH_INTERVAL_SECS, MIN_PUBLISH_INTERVAL_SECS_DEFAULT))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if self._publish_gate is None:
+            self._publish_gate = PublishGate()
+        gate = self._publish_gate
+        now = self.coordinator.hass.loop.time()
+        available = self.available
+        key = self._publish_key() if available else None
+        interval = self._min_publish_interval_secs()
+        if gate.allow(available, key, now, interval):
+            self._cancel_publish_retry()
+            self.async_write_ha_state()
+        elif self._publish_retry is None and (delay := gate.retry_in(key, now, interval)) is not None:
+            self._publish_retry = async_call_later(self.hass, delay, self._retry_publish)
+
+    @callback
+    def _retry_publish(self, _now) -> None:
+        self._publish_retry = None
+        self._handle_coordinator_update()
+
+    @callback
+    def _cancel_publish_retry(self) -> None:
+        if self._publish_retry is not None:
+            self._publish_retry()
+            self._publish_retry = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        self._cancel_publish_retry()
+        await super().async_will_remove_from_hass()
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PodStats:
+    __slots__ = ("refreshes", "late_secs", "max_late_secs", "requests", "wait_secs", "max_wait_secs", "in_flight")
+
+    def __init__(self) -> None:
+        self.refreshes = 0
+        self.late_secs = 0.0
+        self.max_late_secs = 0.0
+        self.requests = 0
+        self.wait_secs = 0.0
+        self.max_wait_secs = 0.0
+        self.in_flight = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "refreshes": self.refreshes,
+            "avg_late_ms": round(self.late_secs * 1000 / self.refreshes, 1) if self.refreshes else None,
+            "max_late_ms": round(self.max_late_secs * 1000, 1),
+            "requests": self.requests,
+            "avg_wait_ms": round(self.wait_secs * 1000 / self.requests, 1) if self.requests else None,
+            "max_wait_ms": round(self.max_wait_secs * 1000, 1),
+            "in_flight": self.in_flight,
+        }
+
+
+class PollJob:
+    __slots__ = ("pod_id", "kind", "refresh", "interval", "due_at", "fire_at", "handle", "task", "active")
+
+    def __init__(
+        self, pod_id: str, kind: str, refresh: Callable[[], Awaitable[None]], interval: Callable[[], float]
+    ) -> None:
+        self.pod_id = pod_id
+        self.kind = kind
+        self.refresh = refresh
+        self.interval = interval
+        self.due_at = 0.0
+        self.fire_at = 0.0
+        self.handle: asyncio.TimerHandle | None = None
+        self.task: asyncio.Task | None = None
+        self.active = True
+
+
+class PollScheduler:
+    def __init__(self, hass: HomeAssistant, max_in_flight: int, jitter_fraction: float, max_jitter_secs: float) -> None:
+        self._hass = hass
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._jitter_fraction = jitter_fraction
+        self._max_jitter_secs = max_jitter_secs
+        self._random = random.Random()
+        self._jobs: list[PollJob] = []
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.pods: dict[str, PodStats] = {}
+
+    @property
+    def idle(self) -> bool:
+        return not self._jobs
+
+    @callback
+    def register(
+        self, pod_id: str, kind: str, refresh: Callable[[], Awaitable[None]], interval: Callable[[], float]
+    ) -> PollJob:
+        job = PollJob(pod_id, kind, refresh, interval)
+        self.pods.setdefault(pod_id, PodStats())
+        job.due_at = self._hass.loop.time() + self._free_phase(kind, interval())
+        self._jobs.append(job)
+        self._arm(job)
+        return job
+
+    @callback
+    def unregister(self, job: PollJob) -> None:
+        job.active = False
+        if job.handle:
+            job.handle.cancel()
+        if job.task and not job.task.done():
+            job.task.cancel()
+        self._jobs.remove(job)
+        if not any(other.pod_id == job.pod_id for other in self._jobs):
+            self.pods.pop(job.pod_id, None)
+
+    def _free_phase(self, kind: str, interval: float) -> float:
+        now = self._hass.loop.time()
+        phases = sorted((job.due_at - now) % interval for job in self._jobs if job.kind == kind)
+        if not phases:
+            return interval
+        gaps = [(phases[0] + interval - phases[-1], phases[-1])]
+        gaps += [(later - earlier, earlier) for earlier, later in zip(phases, phases[1:])]
+        width, start = max(gaps)
+        return (start + width / 2) % interval or interval
+
+    def _arm(self, job: PollJob) -> None:
+        interval = job.interval()
+        jitter = self._random.uniform(0, min(self._max_jitter_secs, interval * self._jitter_fraction))
+        job.fire_at = job.due_at + jitter
+        job.handle = self._hass.loop.call_at(job.fire_at, self._fire, job)
+
+    @callback
+    def _fire(self, job: PollJob) -> None:
+        job.handle = None
+        job.task = self._hass.async_create_background_task(self._run(job), f"free_sleep poll {job.pod_id} {job.kind}")
+
+    async def _run(self, job: PollJob) -> None:
+        stats = self.pods[job.pod_id]
+        late = max(0.0, self._hass.loop.time() - job.fire_at)
+        stats.refreshes += 1
+        stats.late_secs += late
+        stats.max_late_secs = max(stats.max_late_secs, late)
+        try:
+            await job.refresh()
+        except Exception:
+            _LOGGER.exception("Scheduled refresh failed service=free_sleep pod=%s kind=%s", job.pod_id, job.kind)
+        finally:
+            job.task = None
+        if job.active:
+            job.due_at = max(job.due_at + job.interval(), self._hass.loop.time())
+            self._arm(job)
+
+    @asynccontextmanager
+    async def request_slot(self, pod_id: str) -> AsyncIterator[None]:
+        stats = self.pods.get(pod_id) or PodStats()
+        start = self._hass.loop.time()
+        async with self._semaphore:
+            wait = self._hass.loop.time() - start
+            stats.requests += 1
+            stats.wait_secs += wait
+            stats.max_wait_secs = max(stats.max_wait_secs, wait)
+            stats.in_flight += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            try:
+                yield
+            finally:
+                stats.in_flight -= 1
+                self.in_flight -= 1
+
+    def as_dict(self, pod_id: str) -> dict[str, Any]:
+        stats = self.pods.get(pod_id)
+        return {
+            "pods": len(self.pods),
+            "jobs": [job.kind for job in self._jobs if job.pod_id == pod_id],
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "max_in_flight": self.max_in_flight,
+            "pod": stats.as_dict() if stats else None,
+        }
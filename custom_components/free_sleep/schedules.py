@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from typing import Any, Iterator
+
+from .const import SCHEDULE_LOOKAHEAD_DAYS
+
+WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+EVENT_POWER_ON = "power_on"
+EVENT_TEMPERATURE = "temperature"
+EVENT_ALARM = "alarm"
+
+
+@dataclass(slots=True, frozen=True)
+class ScheduleEvent:
+    at: datetime
+    day: str
+    kind: str
+    temperature: float | None
+
+
+def parse_time(value: Any) -> time | None:
+    if not isinstance(value, str):
+        return None
+    try:
+        hours, minutes = value.split(":")
+        return time(int(hours), int(minutes))
+    except ValueError:
+        return None
+
+
+def _occurs(day: date, at: time, night_start: time, tz: tzinfo) -> datetime:
+    if at < night_start:
+        day += timedelta(days=1)
+    return datetime.combine(day, at, tzinfo=tz).astimezone(timezone.utc)
+
+
+def _day_events(raw: Any, day: date, tz: tzinfo) -> Iterator[ScheduleEvent]:
+    if not isinstance(raw, dict):
+        return
+    name = WEEKDAYS[day.weekday()]
+    power = raw.get("power") or {}
+    alarm = raw.get("alarm") or {}
+    night_start = parse_time(power.get("on")) or time(0, 0)
+    if power.get("enabled"):
+        yield ScheduleEvent(_occurs(day, night_start, night_start, tz), name, EVENT_POWER_ON, power.get("onTemperature"))
+        for value, temperature in (raw.get("temperatures") or {}).items():
+            if (at := parse_time(value)) is not None:
+                yield ScheduleEvent(_occurs(day, at, night_start, tz), name, EVENT_TEMPERATURE, temperature)
+    if alarm.get("enabled") and (at := parse_time(alarm.get("time"))) is not None:
+        yield ScheduleEvent(_occurs(day, at, night_start, tz), name, EVENT_ALARM, alarm.get("alarmTemperature"))
+
+
+def next_event(side_schedule: Any, tz: tzinfo, now: datetime, kinds: tuple[str, ...]) -> ScheduleEvent | None:
+    if not isinstance(side_schedule, dict):
+        return None
+    today = now.astimezone(tz).date()
+    best: ScheduleEvent | None = None
+    for offset in range(-1, SCHEDULE_LOOKAHEAD_DAYS):
+        day = today + timedelta(days=offset)
+        for event in _day_events(side_schedule.get(WEEKDAYS[day.weekday()]), day, tz):
+            if event.kind in kinds and event.at > now and (best is None or event.at < best.at):
+                best = event
+    return best
+
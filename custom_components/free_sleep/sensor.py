@@ -1,39 +1,44 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import math
+from datetime import datetime, timedelta
 
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_time, async_track_time_interval
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
-from . import FreeSleepCoordinator
-
-def _resolve_side_name(settings: dict, side: str) -> str:
-    try:
-        name = (settings or {}).get(side, {}).get("name")
-        if isinstance(name, str) and name.strip():
-            return name.strip()
-    except Exception:
-        pass
-    return side.capitalize()
-
+from .breaker import STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN
+from .const import DOMAIN, CONF_SECONDS_REMAINING_QUANTUM_SECS, SECONDS_REMAINING_QUANTUM_SECS_DEFAULT
+from .models import VitalsSummary
+from .publish import GatedPublishMixin, quantize
+from .schedules import EVENT_ALARM, EVENT_POWER_ON, EVENT_TEMPERATURE, ScheduleEvent, next_event
+from .sessions import as_utc
+from . import FreeSleepCoordinator, FreeSleepPresenceCoordinator
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator: FreeSleepCoordinator = data["coordinator"]
-    settings = coordinator.data.get("settings") or {}
-    left_name = _resolve_side_name(settings, "left")
-    right_name = _resolve_side_name(settings, "right")
+    presence_coordinator: FreeSleepPresenceCoordinator = data["presence_coordinator"]
+    left_name = coordinator.settings.side_name("left")
+    right_name = coordinator.settings.side_name("right")
 
     entities = [
         LastPrimeSensor(coordinator, entry),
+        PendingWritesSensor(coordinator, entry),
+        ConnectionStateSensor(coordinator, entry),
+        PodRequestsSensor(coordinator, entry),
+        PodBytesReceivedSensor(coordinator, entry),
+        RefreshDurationSensor(coordinator, entry),
         SideSecondsRemaining(coordinator, entry, side="left", side_name=left_name),
         SideSecondsRemaining(coordinator, entry, side="right", side_name=right_name),
+        SideTimerEndSensor(coordinator, entry, side="left", side_name=left_name),
+        SideTimerEndSensor(coordinator, entry, side="right", side_name=right_name),
     ]
 
     metrics = [
@@ -42,10 +47,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         ("maxHeartRate", "Maximum Heart Rate", "bpm"),
         ("avgHRV", "Average HRV", "ms"),
         ("avgBreathingRate", "Average Breathing Rate", "breaths/min"),
+        ("p10HeartRate", "Heart Rate 10th Percentile", "bpm"),
+        ("p50HeartRate", "Median Heart Rate", "bpm"),
+        ("p90HeartRate", "Heart Rate 90th Percentile", "bpm"),
+        ("p50HRV", "Median HRV", "ms"),
+        ("p50BreathingRate", "Median Breathing Rate", "breaths/min"),
+        ("restingHeartRate", "Resting Heart Rate", "bpm"),
+        ("trendHeartRate", "Heart Rate Trend", "bpm/h"),
     ]
     for side, sname in (("left", left_name), ("right", right_name)):
         for key, label, unit in metrics:
             entities.append(SideVitalsSensor(coordinator, entry, side=side, side_name=sname, key=key, label=label, unit=unit))
+        for session_sensor in (
+            SideBedEntrySensor, SideBedExitSensor, SideTimeInBedSensor, SideBedExitsSensor, SideLastNightSensor,
+        ):
+            entities.append(session_sensor(presence_coordinator, entry, side=side, side_name=sname))
+        for schedule_sensor in (SideNextTemperatureChangeSensor, SideNextAlarmSensor):
+            entities.append(schedule_sensor(coordinator, entry, side=side, side_name=sname))
 
     async_add_entities(entities)
 
@@ -54,24 +72,133 @@ class LastPrimeSensor(CoordinatorEntity, SensorEntity):
     _attr_device_class = SensorDeviceClass.TIMESTAMP
 
     def __init__(self, coordinator: FreeSleepCoordinator, entry: ConfigEntry):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=("settings.lastPrime",))
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_last_prime"
 
     @property
     def native_value(self):
-        raw = (self.coordinator.data.get("settings") or {}).get("lastPrime")
-        if not raw:
-            return None
-        dt = dt_util.parse_datetime(raw)
-        if dt is None:
-            try:
-                dt = datetime.fromisoformat(raw.replace('Z', '+00:00'))
-            except Exception:
-                return None
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt
+        return self.coordinator.settings.last_prime
+
+    @property
+    def extra_state_attributes(self):
+        return {"stale": "settings" in self.coordinator.stale_sections}
+
+    @property
+    def device_info(self):
+        return {
+            "identifiers": {(DOMAIN, f"{self._entry.entry_id}_hub")},
+            "name": "Hub",
+            "manufacturer": "free-sleep (Unofficial)",
+        }
+
+class PendingWritesSensor(CoordinatorEntity, SensorEntity):
+    _attr_name = "Pending Writes"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator: FreeSleepCoordinator, entry: ConfigEntry):
+        super().__init__(coordinator)
+        self._entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_pending_writes"
+
+    @property
+    def native_value(self):
+        return len(self.coordinator.pending_writes)
+
+    @property
+    def extra_state_attributes(self):
+        return {
+            "writes_in_flight": self.coordinator.writes_in_flight,
+            "last_write_latency_ms": self.coordinator.write_latency_ms,
+        }
+
+    @property
+    def device_info(self):
+        return {
+            "identifiers": {(DOMAIN, f"{self._entry.entry_id}_hub")},
+            "name": "Hub",
+            "manufacturer": "free-sleep (Unofficial)",
+        }
+
+class ConnectionStateSensor(GatedPublishMixin, CoordinatorEntity, SensorEntity):
+    _attr_name = "Connection State"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = [STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN]
+    _unrecorded_attributes = frozenset({"retry_in_secs"})
+
+    def __init__(self, coordinator: FreeSleepCoordinator, entry: ConfigEntry):
+        super().__init__(coordinator)
+        self._entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_connection_state"
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    @property
+    def native_value(self):
+        return self.coordinator.client.breaker.state
+
+    def _publish_key(self):
+        breaker = self.coordinator.client.breaker
+        return breaker.state, breaker.consecutive_failures, breaker.trips, frozenset(self.coordinator.stale_sections)
+
+    @property
+    def extra_state_attributes(self):
+        breaker = self.coordinator.client.breaker
+        return {
+            "consecutive_failures": breaker.consecutive_failures,
+            "trips": breaker.trips,
+            "retry_in_secs": breaker.retry_in_secs,
+            "stale_sections": sorted(self.coordinator.stale_sections),
+        }
+
+    @property
+    def device_info(self):
+        return {
+            "identifiers": {(DOMAIN, f"{self._entry.entry_id}_hub")},
+            "name": "Hub",
+            "manufacturer": "free-sleep (Unofficial)",
+        }
+
+class PodRequestsSensor(GatedPublishMixin, CoordinatorEntity, SensorEntity):
+    _attr_name = "Pod Requests"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _rate_limited = True
+
+    def __init__(self, coordinator: FreeSleepCoordinator, entry: ConfigEntry):
+        super().__init__(coordinator)
+        self._entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_pod_requests"
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    @property
+    def native_value(self):
+        return self.coordinator.client.telemetry.requests
+
+    def _publish_key(self):
+        return self.native_value
+
+    @property
+    def extra_state_attributes(self):
+        telemetry = self.coordinator.client.telemetry
+        attributes = {"errors": telemetry.errors}
+        for endpoint, stats in telemetry.endpoints.items():
+            attributes[endpoint] = {
+                "requests": stats.requests,
+                "errors": stats.errors,
+                "unchanged_ratio": stats.unchanged_ratio,
+                "collapsed": stats.collapsed + stats.cache_hits,
+                "p95_ms": stats.latency.quantile(0.95),
+            }
+        return attributes
 
     @property
     def device_info(self):
@@ -81,23 +208,145 @@ class LastPrimeSensor(CoordinatorEntity, SensorEntity):
             "manufacturer": "free-sleep (Unofficial)",
         }
 
-class SideSecondsRemaining(CoordinatorEntity, SensorEntity):
+class PodBytesReceivedSensor(GatedPublishMixin, CoordinatorEntity, SensorEntity):
+    _attr_name = "Pod Bytes Received"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.DATA_SIZE
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = "B"
+    _rate_limited = True
+
+    def __init__(self, coordinator: FreeSleepCoordinator, entry: ConfigEntry):
+        super().__init__(coordinator)
+        self._entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_pod_bytes_received"
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    @property
+    def native_value(self):
+        return self.coordinator.client.telemetry.bytes_received
+
+    def _publish_key(self):
+        return self.native_value
+
+    @property
+    def device_info(self):
+        return {
+            "identifiers": {(DOMAIN, f"{self._entry.entry_id}_hub")},
+            "name": "Hub",
+            "manufacturer": "free-sleep (Unofficial)",
+        }
+
+class RefreshDurationSensor(GatedPublishMixin, CoordinatorEntity, SensorEntity):
+    _attr_name = "Refresh Duration"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "ms"
+    _rate_limited = True
+
+    def __init__(self, coordinator: FreeSleepCoordinator, entry: ConfigEntry):
+        super().__init__(coordinator)
+        self._entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_refresh_duration"
+
+    @property
+    def native_value(self):
+        refresh = self.coordinator.client.telemetry.timings.get("refresh")
+        return refresh.quantile(0.5) if refresh else None
+
+    def _publish_key(self):
+        return self.native_value
+
+    @property
+    def extra_state_attributes(self):
+        attributes = {}
+        for name, histogram in self.coordinator.client.telemetry.timings.items():
+            attributes[f"{name}_p50_ms"] = histogram.quantile(0.5)
+            attributes[f"{name}_p95_ms"] = histogram.quantile(0.95)
+        return attributes
+
+    @property
+    def device_info(self):
+        return {
+            "identifiers": {(DOMAIN, f"{self._entry.entry_id}_hub")},
+            "name": "Hub",
+            "manufacturer": "free-sleep (Unofficial)",
+        }
+
+class SideSecondsRemaining(GatedPublishMixin, CoordinatorEntity, SensorEntity):
     _attr_device_class = SensorDeviceClass.DURATION
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = "s"
+    _rate_limited = True
 
     def __init__(self, coordinator: FreeSleepCoordinator, entry: ConfigEntry, side: str, side_name: str):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(f"deadlines.{side}",))
         self._entry = entry
         self._side = side
         self._side_name = side_name
         self._attr_name = f"{side_name} Seconds Remaining"
         self._attr_unique_id = f"{entry.entry_id}_{side}_seconds_remaining"
 
+    @property
+    def _quantum(self) -> int:
+        return int(self._entry.options.get(CONF_SECONDS_REMAINING_QUANTUM_SECS, SECONDS_REMAINING_QUANTUM_SECS_DEFAULT))
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(async_track_time_interval(self.hass, self._tick, timedelta(seconds=self._quantum)))
+
+    @callback
+    def _tick(self, _now) -> None:
+        if self.coordinator.deadlines.get(self._side) is not None:
+            self._handle_coordinator_update()
+
+    @property
+    def native_value(self):
+        deadline = self.coordinator.deadlines.get(self._side)
+        if deadline is None:
+            return quantize(self.coordinator.device_status.side(self._side).seconds_remaining, self._quantum)
+        return quantize(max(0, math.ceil((deadline - dt_util.utcnow()).total_seconds())), self._quantum)
+
+    def _publish_key(self):
+        return self.native_value, "device_status" in self.coordinator.stale_sections
+
+    @property
+    def extra_state_attributes(self):
+        return {"stale": "device_status" in self.coordinator.stale_sections}
+
+    @property
+    def device_info(self):
+        return {
+            "identifiers": {(DOMAIN, f"{self._entry.entry_id}_{self._side}_device")},
+            "name": self._side_name,
+            "manufacturer": "free-sleep (Unofficial)",
+            "via_device": (DOMAIN, f"{self._entry.entry_id}_hub"),
+        }
+
+class SideTimerEndSensor(CoordinatorEntity, SensorEntity):
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    def __init__(self, coordinator: FreeSleepCoordinator, entry: ConfigEntry, side: str, side_name: str):
+        super().__init__(coordinator, context=(f"deadlines.{side}",))
+        self._entry = entry
+        self._side = side
+        self._side_name = side_name
+        self._attr_name = f"{side_name} Timer End"
+        self._attr_unique_id = f"{entry.entry_id}_{side}_timer_end"
+
     @property
     def native_value(self):
-        side = self.coordinator.data["device_status"].get(self._side, {})
-        return side.get("secondsRemaining")
+        return self.coordinator.deadlines.get(self._side)
+
+    @property
+    def extra_state_attributes(self):
+        return {"stale": "device_status" in self.coordinator.stale_sections}
 
     @property
     def device_info(self):
@@ -112,26 +361,201 @@ class SideVitalsSensor(CoordinatorEntity, SensorEntity):
     _attr_state_class = SensorStateClass.MEASUREMENT
 
     def __init__(self, coordinator: FreeSleepCoordinator, entry: ConfigEntry, side: str, side_name: str, key: str, label: str, unit: str):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(f"vitals.{side}.{key}", "vitals.window_hours"))
         self._entry = entry
         self._side = side
         self._side_name = side_name
         self._key = key
+        self._attribute = VitalsSummary.attribute(key)
         self._label = label
         self._unit = unit
         self._attr_name = f"{side_name} {label}"
         self._attr_unique_id = f"{entry.entry_id}_{side}_{key}_vitals"
         self._attr_native_unit_of_measurement = unit
 
+    @property
+    def available(self) -> bool:
+        return super().available and "vitals" in self.coordinator.data
+
+    @property
+    def native_value(self):
+        return getattr(self.coordinator.vitals[self._side], self._attribute)
+
+    @property
+    def extra_state_attributes(self):
+        return {
+            "window_hours": self.coordinator.vitals[self._side].window_hours,
+            "scope": self.coordinator.vitals[self._side].scope,
+            "stale": "vitals" in self.coordinator.stale_sections,
+        }
+
+    @property
+    def device_info(self):
+        return {
+            "identifiers": {(DOMAIN, f"{self._entry.entry_id}_{self._side}_device")},
+            "name": self._side_name,
+            "manufacturer": "free-sleep (Unofficial)",
+            "via_device": (DOMAIN, f"{self._entry.entry_id}_hub"),
+        }
+
+class SideSessionBaseSensor(CoordinatorEntity, SensorEntity):
+    _label: str
+    _suffix: str
+
+    def __init__(self, coordinator: FreeSleepPresenceCoordinator, entry: ConfigEntry, side: str, side_name: str):
+        super().__init__(coordinator, context=(f"sessions.{side}",))
+        self._entry = entry
+        self._side = side
+        self._side_name = side_name
+        self._attr_name = f"{side_name} {self._label}"
+        self._attr_unique_id = f"{entry.entry_id}_{side}_{self._suffix}"
+
+    @property
+    def _tracker(self):
+        return self.coordinator.sessions[self._side]
+
+    @property
+    def extra_state_attributes(self):
+        return {"stale": self.coordinator.stale}
+
+    @property
+    def device_info(self):
+        return {
+            "identifiers": {(DOMAIN, f"{self._entry.entry_id}_{self._side}_device")},
+            "name": self._side_name,
+            "manufacturer": "free-sleep (Unofficial)",
+            "via_device": (DOMAIN, f"{self._entry.entry_id}_hub"),
+        }
+
+class SideBedEntrySensor(SideSessionBaseSensor):
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _label = "Bed Entry"
+    _suffix = "bed_entry"
+
     @property
     def native_value(self):
-        vitals = (self.coordinator.data.get("vitals") or {}).get(self._side) or {}
-        return vitals.get(self._key)
+        tracker = self._tracker
+        return as_utc(tracker.started_at if tracker.active else None)
 
     @property
     def extra_state_attributes(self):
+        return {**super().extra_state_attributes, "session_state": self._tracker.state}
+
+class SideBedExitSensor(SideSessionBaseSensor):
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _label = "Bed Exit"
+    _suffix = "bed_exit"
+
+    @property
+    def native_value(self):
+        return as_utc(self._tracker.exited_at)
+
+class SideTimeInBedSensor(SideSessionBaseSensor):
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "min"
+    _label = "Time in Bed"
+    _suffix = "time_in_bed"
+
+    @property
+    def native_value(self):
+        tracker = self._tracker
+        if not tracker.active:
+            return 0
+        return round(tracker.time_in_bed_secs(dt_util.utcnow().timestamp()) / 60)
+
+class SideBedExitsSensor(SideSessionBaseSensor):
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _label = "Bed Exits"
+    _suffix = "bed_exits"
+
+    @property
+    def native_value(self):
+        tracker = self._tracker
+        if tracker.active:
+            return tracker.exits
+        return tracker.last_session["exits"] if tracker.last_session else None
+
+class SideLastNightSensor(SideSessionBaseSensor):
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = "h"
+    _label = "Last Night Duration"
+    _suffix = "last_night_duration"
+
+    @property
+    def native_value(self):
+        session = self._tracker.last_session
+        return round(session["in_bed_secs"] / 3600, 2) if session else None
+
+    @property
+    def extra_state_attributes(self):
+        session = self._tracker.last_session or {}
         return {
-            "window_hours": (self.coordinator.data.get("vitals") or {}).get("window_hours"),
+            **super().extra_state_attributes,
+            "started_at": as_utc(session.get("started_at")),
+            "ended_at": as_utc(session.get("ended_at")),
+            "exits": session.get("exits"),
+        }
+
+class SideScheduleBaseSensor(CoordinatorEntity, SensorEntity):
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _label: str
+    _suffix: str
+    _kinds: tuple[str, ...]
+
+    def __init__(self, coordinator: FreeSleepCoordinator, entry: ConfigEntry, side: str, side_name: str):
+        super().__init__(coordinator, context=(f"schedules.{side}", f"settings.{side}.awayMode", "settings.timeZone"))
+        self._entry = entry
+        self._side = side
+        self._side_name = side_name
+        self._attr_name = f"{side_name} {self._label}"
+        self._attr_unique_id = f"{entry.entry_id}_{side}_{self._suffix}"
+        self._event: ScheduleEvent | None = None
+        self._unsub_point: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self._schedule_next(dt_util.utcnow())
+        self.async_on_remove(self._cancel_point)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._schedule_next(dt_util.utcnow())
+        super()._handle_coordinator_update()
+
+    @callback
+    def _handle_point(self, now: datetime) -> None:
+        self._unsub_point = None
+        self._schedule_next(now)
+        self.async_write_ha_state()
+
+    @callback
+    def _schedule_next(self, now: datetime) -> None:
+        self._cancel_point()
+        settings = self.coordinator.settings
+        tz = (settings.time_zone and dt_util.get_time_zone(settings.time_zone)) or dt_util.DEFAULT_TIME_ZONE
+        side_schedule = None if settings.side(self._side).away_mode else self.coordinator.schedules.get(self._side)
+        self._event = next_event(side_schedule, tz, now, self._kinds)
+        if self._event is not None:
+            self._unsub_point = async_track_point_in_time(self.hass, self._handle_point, self._event.at)
+
+    @callback
+    def _cancel_point(self) -> None:
+        if self._unsub_point:
+            self._unsub_point()
+            self._unsub_point = None
+
+    @property
+    def native_value(self):
+        return self._event.at if self._event else None
+
+    @property
+    def extra_state_attributes(self):
+        event = self._event
+        return {
+            "schedule_day": event.day if event else None,
+            "temperature_f": event.temperature if event else None,
+            "stale": "schedules" in self.coordinator.stale_sections,
         }
 
     @property
@@ -142,3 +566,17 @@ class SideVitalsSensor(CoordinatorEntity, SensorEntity):
             "manufacturer": "free-sleep (Unofficial)",
             "via_device": (DOMAIN, f"{self._entry.entry_id}_hub"),
         }
+
+class SideNextTemperatureChangeSensor(SideScheduleBaseSensor):
+    _label = "Next Temperature Change"
+    _suffix = "next_temperature_change"
+    _kinds = (EVENT_POWER_ON, EVENT_TEMPERATURE)
+
+    @property
+    def extra_state_attributes(self):
+        return {**super().extra_state_attributes, "kind": self._event.kind if self._event else None}
+
+class SideNextAlarmSensor(SideScheduleBaseSensor):
+    _label = "Next Alarm"
+    _suffix = "next_alarm"
+    _kinds = (EVENT_ALARM,)
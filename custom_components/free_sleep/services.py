@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import DOMAIN, SERVICE_APPLY_STATE, MIN_TEMPERATURE_F, MAX_TEMPERATURE_F
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_LINK_BOTH_SIDES = "link_both_sides"
+ATTR_IS_ON = "is_on"
+ATTR_TARGET_TEMPERATURE = "target_temperature"
+ATTR_AWAY_MODE = "away_mode"
+
+SIDE_STATE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_IS_ON): cv.boolean,
+    vol.Optional(ATTR_TARGET_TEMPERATURE): vol.All(vol.Coerce(float), vol.Range(min=MIN_TEMPERATURE_F, max=MAX_TEMPERATURE_F)),
+    vol.Optional(ATTR_AWAY_MODE): cv.boolean,
+})
+
+APPLY_STATE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Optional(ATTR_LINK_BOTH_SIDES): cv.boolean,
+    vol.Optional("left"): SIDE_STATE_SCHEMA,
+    vol.Optional("right"): SIDE_STATE_SCHEMA,
+})
+
+
+def build_payloads(desired: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    device_status: dict[str, Any] = {}
+    settings: dict[str, Any] = {}
+    if ATTR_LINK_BOTH_SIDES in desired:
+        settings["linkBothSides"] = desired[ATTR_LINK_BOTH_SIDES]
+    for side in ("left", "right"):
+        state = desired.get(side) or {}
+        status = {
+            field: state[attr]
+            for attr, field in ((ATTR_IS_ON, "isOn"), (ATTR_TARGET_TEMPERATURE, "targetTemperatureF"))
+            if attr in state
+        }
+        if status:
+            device_status[side] = status
+        if ATTR_AWAY_MODE in state:
+            settings[side] = {"awayMode": state[ATTR_AWAY_MODE]}
+    return {"device_status": device_status, "settings": settings}
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    if hass.services.has_service(DOMAIN, SERVICE_APPLY_STATE):
+        return
+
+    async def async_apply_state(call: ServiceCall) -> None:
+        domain_data = hass.data.get(DOMAIN, {})
+        if entry_id := call.data.get(ATTR_CONFIG_ENTRY_ID):
+            if entry_id not in domain_data:
+                raise ServiceValidationError(f"Free Sleep entry {entry_id} is not loaded")
+            entry_ids = [entry_id]
+        else:
+            entry_ids = [entry.entry_id for entry in hass.config_entries.async_entries(DOMAIN) if entry.entry_id in domain_data]
+        payloads = build_payloads(call.data)
+        await asyncio.gather(
+            *(domain_data[entry_id]["coordinator"].async_apply_state(payloads) for entry_id in entry_ids)
+        )
+
+    hass.services.async_register(DOMAIN, SERVICE_APPLY_STATE, async_apply_state, schema=APPLY_STATE_SCHEMA)
+
+
+@callback
+def async_unload_services(hass: HomeAssistant) -> None:
+    domain_data = hass.data.get(DOMAIN, {})
+    if not any(entry.entry_id in domain_data for entry in hass.config_entries.async_entries(DOMAIN)):
+        hass.services.async_remove(DOMAIN, SERVICE_APPLY_STATE)
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any
+
+STATE_OUT = "out"
+STATE_IN_BED = "in_bed"
+STATE_AWAY = "away"
+
+BED_ENTRY = "bed_entry"
+BED_EXIT = "bed_exit"
+SESSION_END = "session_end"
+
+
+def as_utc(ts: float | None) -> datetime | None:
+    return None if ts is None else datetime.fromtimestamp(ts, timezone.utc)
+
+
+_PERSISTED = ("state", "started_at", "in_bed_since", "exited_at", "exits", "in_bed_secs", "last_session")
+
+
+class SleepSessionTracker:
+    __slots__ = (*_PERSISTED, "seeded")
+
+    def __init__(self) -> None:
+        self.state = STATE_OUT
+        self.started_at: float | None = None
+        self.in_bed_since: float | None = None
+        self.exited_at: float | None = None
+        self.exits = 0
+        self.in_bed_secs = 0.0
+        self.last_session: dict[str, float] | None = None
+        self.seeded = False
+
+    def observe(self, present: bool | None, now: float, end_gap_secs: float, min_session_secs: float) -> str | None:
+        if present is None:
+            return None
+        if not self.seeded:
+            self.seeded = not present
+            return None
+        if self.state == STATE_OUT:
+            if not present:
+                return None
+            self.state = STATE_IN_BED
+            self.started_at = self.in_bed_since = now
+            self.exited_at = None
+            self.exits = 0
+            self.in_bed_secs = 0.0
+            return BED_ENTRY
+        if self.state == STATE_IN_BED:
+            if present:
+                return None
+            self._exit(now)
+            return BED_EXIT
+        if present:
+            self.state = STATE_IN_BED
+            self.in_bed_since = now
+            return BED_ENTRY
+        if now - self.exited_at < end_gap_secs:
+            return None
+        return self._end(min_session_secs)
+
+    def _exit(self, now: float) -> None:
+        self.state = STATE_AWAY
+        self.in_bed_secs += now - self.in_bed_since
+        self.exited_at = now
+        self.exits += 1
+
+    def _end(self, min_session_secs: float) -> str | None:
+        self.state = STATE_OUT
+        if self.in_bed_secs < min_session_secs:
+            return None
+        self.last_session = {
+            "started_at": self.started_at,
+            "ended_at": self.exited_at,
+            "in_bed_secs": self.in_bed_secs,
+            "exits": self.exits - 1,
+        }
+        return SESSION_END
+
+    @property
+    def active(self) -> bool:
+        return self.state != STATE_OUT
+
+    def time_in_bed_secs(self, now: float) -> float:
+        if self.state == STATE_IN_BED:
+            return self.in_bed_secs + now - self.in_bed_since
+        return self.in_bed_secs
+
+    def revision(self, now: float) -> tuple[Any, ...]:
+        ended_at = self.last_session["ended_at"] if self.last_session else None
+        return self.state, self.started_at, self.exited_at, self.exits, ended_at, int(self.time_in_bed_secs(now) // 60)
+
+    def span(self, now: float) -> tuple[float, float] | None:
+        if self.active:
+            return self.started_at, now
+        if self.last_session:
+            return self.last_session["started_at"], self.last_session["ended_at"]
+        return None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {slot: getattr(self, slot) for slot in _PERSISTED}
+
+    def restore(
+        self, raw: dict[str, Any] | None, saved_at: float | None, now: float, end_gap_secs: float, min_session_secs: float
+    ) -> None:
+        if not isinstance(raw, dict) or raw.get("state") not in (STATE_OUT, STATE_IN_BED, STATE_AWAY):
+            return
+        for slot in _PERSISTED:
+            if slot in raw:
+                setattr(self, slot, raw[slot])
+        recent = saved_at is not None and now - saved_at < end_gap_secs
+        if self.state == STATE_IN_BED and not recent:
+            self._exit(max(saved_at or 0.0, self.in_bed_since))
+        if self.state == STATE_AWAY and now - self.exited_at >= end_gap_secs:
+            self._end(min_session_secs)
+        self.seeded = recent
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, SNAPSHOT_STORAGE_VERSION, SNAPSHOT_VOLATILE_FIELDS
+from .dispatch import without_fields
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def restartable(key: str, value: Any) -> Any:
+    fields = SNAPSHOT_VOLATILE_FIELDS.get(key)
+    return without_fields(value, fields) if fields else value
+
+
+class SnapshotStore:
+    def __init__(self, hass: HomeAssistant, entry_id: str, save_delay_secs: float) -> None:
+        self._store: Store[dict[str, Any]] = Store(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot")
+        self._save_delay_secs = save_delay_secs
+        self._sections: dict[str, Any] = {}
+        self._seen: dict[str, Any] = {}
+        self._save_pending = False
+        self.restored_from: str | None = None
+        self.saved_at: str | None = None
+        self.saves = 0
+        self.unchanged = 0
+
+    async def async_load(self) -> dict[str, Any] | None:
+        try:
+            stored = await self._store.async_load()
+        except HomeAssistantError as err:
+            _LOGGER.warning("Discarding unreadable snapshot service=free_sleep error=%r", err)
+            return None
+        if not isinstance(stored, dict) or not isinstance(stored.get("sections"), dict):
+            return None
+        self._sections = dict(stored["sections"])
+        self.restored_from = stored.get("saved_at")
+        return dict(self._sections)
+
+    @callback
+    def async_update(self, sections: dict[str, Any]) -> None:
+        changed: dict[str, Any] = {}
+        for key, value in sections.items():
+            if value is self._seen.get(key):
+                continue
+            self._seen[key] = value
+            value = restartable(key, value)
+            if value != self._sections.get(key):
+                changed[key] = value
+        if not changed:
+            self.unchanged += 1
+            return
+        self._sections.update(changed)
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_save, self._save_delay_secs)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        self._save_pending = False
+        self.saves += 1
+        self.saved_at = dt_util.utcnow().isoformat()
+        return {"saved_at": self.saved_at, "sections": dict(self._sections)}
+
+    async def async_flush(self) -> None:
+        if self._sections:
+            await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        self._save_pending = False
+        await self._store.async_remove()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "restored_from": self.restored_from,
+            "saved_at": self.saved_at,
+            "saves": self.saves,
+            "unchanged": self.unchanged,
+            "save_pending": self._save_pending,
+            "sections": sorted(self._sections),
+        }
@@ -1,7 +1,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
@@ -10,25 +9,14 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, API_SETTINGS
+from .const import DOMAIN
 from . import FreeSleepCoordinator
 
-def _resolve_side_name(settings: dict, side: str) -> str:
-    try:
-        name = (settings or {}).get(side, {}).get("name")
-        if isinstance(name, str) and name.strip():
-            return name.strip()
-    except Exception:
-        pass
-    return side.capitalize()
-
-
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator: FreeSleepCoordinator = data["coordinator"]
-    settings = coordinator.data.get("settings") or {}
-    left_name = _resolve_side_name(settings, "left")
-    right_name = _resolve_side_name(settings, "right")
+    left_name = coordinator.settings.side_name("left")
+    right_name = coordinator.settings.side_name("right")
     entities = [
         LinkBothSidesSwitch(coordinator, entry),
         SideAwayModeSwitch(coordinator, entry, side="left", side_name=left_name),
@@ -38,15 +26,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 
 class LinkBothSidesSwitch(CoordinatorEntity, SwitchEntity):
     def __init__(self, coordinator: FreeSleepCoordinator, entry: ConfigEntry):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=("settings.linkBothSides",))
         self._entry = entry
         self._attr_name = "Link Both Sides"
         self._attr_unique_id = f"{entry.entry_id}_link_both_sides"
 
     @property
     def is_on(self) -> bool | None:
-        settings = self.coordinator.data.get("settings") or {}
-        return bool(settings.get("linkBothSides"))
+        return self.coordinator.settings.link_both_sides
+
+    @property
+    def extra_state_attributes(self):
+        return {"stale": "settings" in self.coordinator.stale_sections}
 
     @property
     def device_info(self):
@@ -57,24 +48,14 @@ class LinkBothSidesSwitch(CoordinatorEntity, SwitchEntity):
         }
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        if "settings" not in self.coordinator.data:
-            self.coordinator.data["settings"] = {}
-        self.coordinator.data["settings"]["linkBothSides"] = True
-        self.async_write_ha_state()
-        asyncio.create_task(self.coordinator.client.post(API_SETTINGS, {"linkBothSides": True}))
-        self.coordinator.defer_refresh()
+        await self.coordinator.async_write("settings", {"linkBothSides": True})
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        if "settings" not in self.coordinator.data:
-            self.coordinator.data["settings"] = {}
-        self.coordinator.data["settings"]["linkBothSides"] = False
-        self.async_write_ha_state()
-        asyncio.create_task(self.coordinator.client.post(API_SETTINGS, {"linkBothSides": False}))
-        self.coordinator.defer_refresh()
+        await self.coordinator.async_write("settings", {"linkBothSides": False})
 
 class SideAwayModeSwitch(CoordinatorEntity, SwitchEntity):
     def __init__(self, coordinator: FreeSleepCoordinator, entry: ConfigEntry, side: str, side_name: str):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(f"settings.{side}.awayMode",))
         self._entry = entry
         self._side = side
         self._side_name = side_name
@@ -83,9 +64,11 @@ class SideAwayModeSwitch(CoordinatorEntity, SwitchEntity):
 
     @property
     def is_on(self) -> bool | None:
-        settings = self.coordinator.data.get("settings") or {}
-        side_settings = settings.get(self._side) or {}
-        return bool(side_settings.get("awayMode"))
+        return self.coordinator.settings.side(self._side).away_mode
+
+    @property
+    def extra_state_attributes(self):
+        return {"stale": "settings" in self.coordinator.stale_sections}
 
     @property
     def device_info(self):
@@ -97,21 +80,7 @@ class SideAwayModeSwitch(CoordinatorEntity, SwitchEntity):
         }
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        if "settings" not in self.coordinator.data:
-            self.coordinator.data["settings"] = {}
-        if self._side not in self.coordinator.data["settings"]:
-            self.coordinator.data["settings"][self._side] = {}
-        self.coordinator.data["settings"][self._side]["awayMode"] = True
-        self.async_write_ha_state()
-        asyncio.create_task(self.coordinator.client.post(API_SETTINGS, {self._side: {"awayMode": True}}))
-        self.coordinator.defer_refresh()
+        await self.coordinator.async_write("settings", {self._side: {"awayMode": True}})
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        if "settings" not in self.coordinator.data:
-            self.coordinator.data["settings"] = {}
-        if self._side not in self.coordinator.data["settings"]:
-            self.coordinator.data["settings"][self._side] = {}
-        self.coordinator.data["settings"][self._side]["awayMode"] = False
-        self.async_write_ha_state()
-        asyncio.create_task(self.coordinator.client.post(API_SETTINGS, {self._side: {"awayMode": False}}))
-        self.coordinator.defer_refresh()
\ No newline at end of file
+        await self.coordinator.async_write("settings", {self._side: {"awayMode": False}})
\ No newline at end of file
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from typing import Any
+
+
+class LatencyHistogram:
+    __slots__ = ("_bounds", "_counts", "count", "sum_ms", "max_ms")
+
+    def __init__(self, bounds_ms: tuple[float, ...]) -> None:
+        self._bounds = bounds_ms
+        self._counts = array("Q", bytes(8 * (len(bounds_ms) + 1)))
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        self._counts[bisect_left(self._bounds, ms)] += 1
+        self.count += 1
+        self.sum_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def quantile(self, q: float) -> float | None:
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket in enumerate(self._counts):
+            if bucket and seen + bucket >= rank:
+                lower = self._bounds[index - 1] if index else 0.0
+                upper = min(self._bounds[index], self.max_ms) if index < len(self._bounds) else self.max_ms
+                return round(lower + (upper - lower) * (rank - seen) / bucket, 1)
+            seen += bucket
+        return round(self.max_ms, 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        labels = [f"le_{bound}" for bound in self._bounds] + ["inf"]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.sum_ms / self.count, 1) if self.count else None,
+            "max_ms": round(self.max_ms, 1),
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "buckets": dict(zip(labels, self._counts)),
+        }
+
+
+class EndpointStats:
+    __slots__ = ("requests", "errors", "unchanged", "collapsed", "cache_hits", "bytes_received", "latency")
+
+    def __init__(self, bounds_ms: tuple[float, ...]) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.unchanged = 0
+        self.collapsed = 0
+        self.cache_hits = 0
+        self.bytes_received = 0
+        self.latency = LatencyHistogram(bounds_ms)
+
+    @property
+    def unchanged_ratio(self) -> float | None:
+        return round(self.unchanged / self.requests, 3) if self.requests else None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "unchanged": self.unchanged,
+            "unchanged_ratio": self.unchanged_ratio,
+            "collapsed": self.collapsed,
+            "cache_hits": self.cache_hits,
+            "bytes_received": self.bytes_received,
+            "latency": self.latency.as_dict(),
+        }
+
+
+class Telemetry:
+    def __init__(self, bounds_ms: tuple[float, ...]) -> None:
+        self._bounds = bounds_ms
+        self.endpoints: dict[str, EndpointStats] = {}
+        self.timings: dict[str, LatencyHistogram] = {}
+
+    def _stats(self, endpoint: str) -> EndpointStats:
+        stats = self.endpoints.get(endpoint)
+        if stats is None:
+            stats = self.endpoints[endpoint] = EndpointStats(self._bounds)
+        return stats
+
+    def record_request(
+        self, endpoint: str, ms: float, bytes_received: int, error: bool, unchanged: bool = False
+    ) -> None:
+        stats = self._stats(endpoint)
+        stats.requests += 1
+        stats.bytes_received += bytes_received
+        if error:
+            stats.errors += 1
+        if unchanged:
+            stats.unchanged += 1
+        stats.latency.observe(ms)
+
+    def record_collapsed(self, endpoint: str, cached: bool) -> None:
+        stats = self._stats(endpoint)
+        if cached:
+            stats.cache_hits += 1
+        else:
+            stats.collapsed += 1
+
+    def record_timing(self, name: str, ms: float) -> None:
+        histogram = self.timings.get(name)
+        if histogram is None:
+            histogram = self.timings[name] = LatencyHistogram(self._bounds)
+        histogram.observe(ms)
+
+    @property
+    def requests(self) -> int:
+        return sum(stats.requests for stats in self.endpoints.values())
+
+    @property
+    def errors(self) -> int:
+        return sum(stats.errors for stats in self.endpoints.values())
+
+    @property
+    def collapsed(self) -> int:
+        return sum(stats.collapsed + stats.cache_hits for stats in self.endpoints.values())
+
+    @property
+    def bytes_received(self) -> int:
+        return sum(stats.bytes_received for stats in self.endpoints.values())
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "endpoints": {name: stats.as_dict() for name, stats in sorted(self.endpoints.items())},
+            "timings": {name: histogram.as_dict() for name, histogram in sorted(self.timings.items())},
+        }
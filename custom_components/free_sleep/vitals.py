@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import math
+from array import array
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    VITALS_TREND_WINDOW_SECS, VITALS_TREND_MIN_SAMPLES, VITALS_TREND_MIN_SPAN_SECS,
+    VITALS_RESTING_WINDOW_SECS, VITALS_RESTING_MIN_SAMPLES,
+)
+
+VITALS_FIELDS = {
+    "HeartRate": "heart_rate",
+    "HRV": "hrv",
+    "BreathingRate": "breathing_rate",
+}
+
+VITALS_HISTOGRAM_BINS = {
+    "HeartRate": (20.0, 220.0, 1.0),
+    "HRV": (0.0, 300.0, 1.0),
+    "BreathingRate": (0.0, 60.0, 0.5),
+}
+
+VITALS_PERCENTILES = (10, 50, 90)
+
+
+class SampleHistogram:
+    __slots__ = ("_low", "_step", "_bins", "count")
+
+    def __init__(self, low: float, high: float, step: float) -> None:
+        self._low = low
+        self._step = step
+        self._bins = array("I", [0]) * (int((high - low) / step) + 1)
+        self.count = 0
+
+    def _bin(self, value: float) -> int:
+        return min(len(self._bins) - 1, max(0, int((value - self._low) / self._step)))
+
+    def add(self, value: float) -> None:
+        self._bins[self._bin(value)] += 1
+        self.count += 1
+
+    def remove(self, value: float) -> None:
+        self._bins[self._bin(value)] -= 1
+        self.count -= 1
+
+    def quantile(self, q: float) -> float | None:
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index, bin_count in enumerate(self._bins):
+            seen += bin_count
+            if seen >= rank:
+                return round(self._low + index * self._step, 1)
+        return None
+
+
+class VitalsHistory:
+    __slots__ = ("capacity", "timestamps", "values", "total")
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.timestamps = array("d", [0.0]) * capacity
+        self.values = {name: array("f", [math.nan]) * capacity for name in VITALS_FIELDS}
+        self.total = 0
+
+    @property
+    def first_seq(self) -> int:
+        return max(0, self.total - self.capacity)
+
+    @property
+    def nbytes(self) -> int:
+        arrays = (self.timestamps, *self.values.values())
+        return sum(values.itemsize * len(values) for values in arrays)
+
+    def __len__(self) -> int:
+        return self.total - self.first_seq
+
+    def push(self, ts: float, record: dict) -> None:
+        index = self.total % self.capacity
+        self.timestamps[index] = ts
+        for name, field in VITALS_FIELDS.items():
+            value = record.get(field)
+            self.values[name][index] = math.nan if value is None else value
+        self.total += 1
+
+    def timestamp(self, seq: int) -> float:
+        return self.timestamps[seq % self.capacity]
+
+    def value(self, name: str, seq: int) -> float:
+        return self.values[name][seq % self.capacity]
+
+    def seek(self, ts: float) -> int:
+        low, high = self.first_seq, self.total
+        while low < high:
+            middle = (low + high) // 2
+            if self.timestamp(middle) < ts:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+
+class RollingVitalsWindow:
+    def __init__(self, window_hours: int, capacity: int) -> None:
+        self.window_hours = window_hours
+        self.cursor: datetime | None = None
+        self.history = VitalsHistory(capacity)
+        self._start_seq = 0
+        self._sums = dict.fromkeys(VITALS_FIELDS, 0.0)
+        self._counts = dict.fromkeys(VITALS_FIELDS, 0)
+        self._histograms = {name: SampleHistogram(*VITALS_HISTOGRAM_BINS[name]) for name in VITALS_FIELDS}
+        self._lows: dict[str, deque[tuple[int, float]]] = {name: deque() for name in VITALS_FIELDS}
+        self._highs: dict[str, deque[tuple[int, float]]] = {name: deque() for name in VITALS_FIELDS}
+        self._resting_head = 0
+        self._resting_sum = 0.0
+        self._resting_count = 0
+        self._resting_lows: deque[tuple[int, float]] = deque()
+
+    def fetch_start(self, now: datetime) -> datetime:
+        if self.cursor is None:
+            return now - timedelta(hours=self.window_hours)
+        return self.cursor
+
+    def ingest(self, records: list[dict]) -> None:
+        history = self.history
+        for record in records:
+            when = dt_util.parse_datetime(record["timestamp"])
+            if self.cursor is not None and when <= self.cursor:
+                continue
+            if history.total - self._start_seq >= history.capacity:
+                self._drop_oldest()
+            seq = history.total
+            history.push(when.timestamp(), record)
+            for name in VITALS_FIELDS:
+                value = history.value(name, seq)
+                if not math.isnan(value):
+                    self._sums[name] += value
+                    self._counts[name] += 1
+                    self._histograms[name].add(value)
+                    self._push_extremes(name, seq, value)
+            self._advance_resting(seq)
+            self.cursor = when
+
+    def _push_extremes(self, name: str, seq: int, value: float) -> None:
+        lows = self._lows[name]
+        while lows and lows[-1][1] >= value:
+            lows.pop()
+        lows.append((seq, value))
+        highs = self._highs[name]
+        while highs and highs[-1][1] <= value:
+            highs.pop()
+        highs.append((seq, value))
+
+    def _advance_resting(self, seq: int) -> None:
+        history = self.history
+        value = history.value("HeartRate", seq)
+        if not math.isnan(value):
+            self._resting_sum += value
+            self._resting_count += 1
+        ts = history.timestamp(seq)
+        while ts - history.timestamp(self._resting_head) > VITALS_RESTING_WINDOW_SECS:
+            self._drop_resting_head()
+        if self._resting_count >= VITALS_RESTING_MIN_SAMPLES:
+            average = self._resting_sum / self._resting_count
+            lows = self._resting_lows
+            while lows and lows[-1][1] >= average:
+                lows.pop()
+            lows.append((self._resting_head, average))
+
+    def _drop_resting_head(self) -> None:
+        value = self.history.value("HeartRate", self._resting_head)
+        if not math.isnan(value):
+            self._resting_sum -= value
+            self._resting_count -= 1
+        self._resting_head += 1
+
+    def _drop_oldest(self) -> None:
+        seq = self._start_seq
+        for name in VITALS_FIELDS:
+            value = self.history.value(name, seq)
+            if not math.isnan(value):
+                self._sums[name] -= value
+                self._counts[name] -= 1
+                self._histograms[name].remove(value)
+            for extremes in (self._lows[name], self._highs[name]):
+                if extremes and extremes[0][0] <= seq:
+                    extremes.popleft()
+        if self._resting_head == seq:
+            self._drop_resting_head()
+        self._start_seq += 1
+        while self._resting_lows and self._resting_lows[0][0] < self._start_seq:
+            self._resting_lows.popleft()
+
+    def evict(self, now: datetime) -> None:
+        cutoff = (now - timedelta(hours=self.window_hours)).timestamp()
+        history = self.history
+        while self._start_seq < history.total and history.timestamp(self._start_seq) < cutoff:
+            self._drop_oldest()
+
+    def summary(self, now: datetime, span: tuple[float, float] | None = None) -> dict[str, Any]:
+        if span is None:
+            sums, counts, histograms = self._sums, self._counts, self._histograms
+            extremes = {
+                name: (self._lows[name][0][1], self._highs[name][0][1]) if self._lows[name] else (math.nan, math.nan)
+                for name in VITALS_FIELDS
+            }
+            resting = round(self._resting_lows[0][1], 1) if self._resting_lows else None
+        else:
+            start = max(self._start_seq, self.history.seek(span[0]))
+            end = max(start, self.history.seek(math.nextafter(span[1], math.inf)))
+            sums, counts, histograms, extremes = self._scan(start, end)
+            resting = self._resting("HeartRate", start, end)
+        summary: dict[str, Any] = {"scope": "window" if span is None else "session"}
+        for name in VITALS_FIELDS:
+            count = counts[name]
+            low, high = extremes[name]
+            summary[f"avg{name}"] = round(sums[name] / count, 1) if count else None
+            summary[f"min{name}"] = None if math.isnan(low) else round(low, 1)
+            summary[f"max{name}"] = None if math.isnan(high) else round(high, 1)
+            for pct in VITALS_PERCENTILES:
+                summary[f"p{pct}{name}"] = histograms[name].quantile(pct / 100)
+        summary["trendHeartRate"] = self._trend("HeartRate", now.timestamp() - VITALS_TREND_WINDOW_SECS)
+        summary["restingHeartRate"] = resting
+        return summary
+
+    def _scan(self, start: int, end: int) -> tuple[
+        dict[str, float], dict[str, int], dict[str, SampleHistogram], dict[str, tuple[float, float]]
+    ]:
+        sums = dict.fromkeys(VITALS_FIELDS, 0.0)
+        counts = dict.fromkeys(VITALS_FIELDS, 0)
+        histograms = {name: SampleHistogram(*VITALS_HISTOGRAM_BINS[name]) for name in VITALS_FIELDS}
+        extremes: dict[str, tuple[float, float]] = {}
+        capacity = self.history.capacity
+        for name, values in self.history.values.items():
+            histogram = histograms[name]
+            low = high = math.nan
+            for seq in range(start, end):
+                value = values[seq % capacity]
+                if math.isnan(value):
+                    continue
+                sums[name] += value
+                counts[name] += 1
+                histogram.add(value)
+                if not value >= low:
+                    low = value
+                if not value <= high:
+                    high = value
+            extremes[name] = (low, high)
+        return sums, counts, histograms, extremes
+
+    def _trend(self, name: str, since: float) -> float | None:
+        history = self.history
+        n = sum_x = sum_y = sum_xx = sum_xy = 0.0
+        first_x = last_x = None
+        for seq in range(max(self._start_seq, history.seek(since)), history.total):
+            value = history.value(name, seq)
+            if math.isnan(value):
+                continue
+            x = (history.timestamp(seq) - since) / 3600
+            first_x = x if first_x is None else first_x
+            last_x = x
+            n += 1
+            sum_x += x
+            sum_y += value
+            sum_xx += x * x
+            sum_xy += x * value
+        denominator = n * sum_xx - sum_x * sum_x
+        if n < VITALS_TREND_MIN_SAMPLES or (last_x - first_x) * 3600 < VITALS_TREND_MIN_SPAN_SECS:
+            return None
+        return round((n * sum_xy - sum_x * sum_y) / denominator, 1)
+
+    def _resting(self, name: str, start: int, end: int) -> float | None:
+        history = self.history
+        timestamps = history.timestamps
+        values = history.values[name]
+        capacity = history.capacity
+        best = math.inf
+        total = 0.0
+        count = 0
+        head = start
+        for seq in range(start, end):
+            ts = timestamps[seq % capacity]
+            value = values[seq % capacity]
+            if not math.isnan(value):
+                total += value
+                count += 1
+            while ts - timestamps[head % capacity] > VITALS_RESTING_WINDOW_SECS:
+                dropped = values[head % capacity]
+                if not math.isnan(dropped):
+                    total -= dropped
+                    count -= 1
+                head += 1
+            if count >= VITALS_RESTING_MIN_SAMPLES and total < best * count:
+                best = total / count
+        return None if best == math.inf else round(best, 1)
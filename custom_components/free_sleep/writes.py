@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Iterable
+
+from homeassistant.core import HomeAssistant
+
+from .coordinator import FreeSleepClient
+from .dispatch import expand_paths, flatten_paths
+
+
+def deep_merge(target: dict[str, Any], update: dict[str, Any]) -> dict[str, Any]:
+    for key, value in update.items():
+        if isinstance(value, dict):
+            target[key] = deep_merge(target[key] if isinstance(target.get(key), dict) else {}, value)
+        else:
+            target[key] = value
+    return target
+
+
+def diff_payload(current: dict[str, Any], payload: dict[str, Any]) -> dict[str, Any]:
+    changed: dict[str, Any] = {}
+    for key, value in payload.items():
+        existing = current.get(key)
+        if isinstance(value, dict):
+            if nested := diff_payload(existing if isinstance(existing, dict) else {}, value):
+                changed[key] = nested
+        elif key not in current or existing != value:
+            changed[key] = value
+    return changed
+
+
+class PendingWrite:
+    __slots__ = ("data_key", "payload", "expected", "deadline", "acknowledged")
+
+    def __init__(self, data_key: str, payload: dict[str, Any], deadline: float) -> None:
+        self.data_key = data_key
+        self.payload = payload
+        self.expected = flatten_paths(payload)
+        self.deadline = deadline
+        self.acknowledged = False
+
+    def confirmed_by(self, section: dict[str, Any]) -> bool:
+        current = flatten_paths(section)
+        return all(current.get(path) == value for path, value in self.expected.items())
+
+    def supersede(self, paths: Iterable[str]) -> bool:
+        for path in paths:
+            self.expected.pop(path, None)
+        self.payload = expand_paths(self.expected)
+        return bool(self.expected)
+
+
+class CoalescingWriteQueue:
+    def __init__(self, hass: HomeAssistant, client: FreeSleepClient, window_secs: float) -> None:
+        self._hass = hass
+        self._client = client
+        self._window_secs = window_secs
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._waiters: dict[str, list[asyncio.Future]] = {}
+        self._flush_handles: dict[str, asyncio.TimerHandle] = {}
+        self._send_locks: dict[str, asyncio.Lock] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    def submit(self, path: str, payload: dict[str, Any]) -> asyncio.Future:
+        deep_merge(self._pending.setdefault(path, {}), payload)
+        waiter = self._hass.loop.create_future()
+        self._waiters.setdefault(path, []).append(waiter)
+        if path not in self._flush_handles:
+            self._flush_handles[path] = self._hass.loop.call_later(self._window_secs, self._flush, path)
+        return waiter
+
+    def _flush(self, path: str) -> None:
+        del self._flush_handles[path]
+        payload = self._pending.pop(path)
+        waiters = self._waiters.pop(path)
+        task = self._hass.async_create_task(self._send(path, payload, waiters))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def async_shutdown(self) -> None:
+        for handle in self._flush_handles.values():
+            handle.cancel()
+        for waiter in (waiter for waiters in self._waiters.values() for waiter in waiters):
+            waiter.cancel()
+        self._flush_handles.clear()
+        self._pending.clear()
+        self._waiters.clear()
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _send(self, path: str, payload: dict[str, Any], waiters: list[asyncio.Future]) -> None:
+        try:
+            async with self._send_locks.setdefault(path, asyncio.Lock()):
+                result = await self._client.post(path, payload)
+        except asyncio.CancelledError:
+            for waiter in waiters:
+                waiter.cancel()
+            raise
+        except Exception as err:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(err)
+            return
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(result)